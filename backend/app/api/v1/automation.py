@@ -6,7 +6,7 @@ Uses API key authentication instead of Clerk.
 from uuid import UUID
 import secrets
 
-from fastapi import APIRouter, Depends, HTTPException, Header, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
@@ -15,6 +15,7 @@ from app.database import get_session
 from app.crud import project_crud
 from app.models import ProjectStatus, User
 from app.api.v1.projects import run_pipeline_background
+from app.services.job_queue import job_queue
 from app.utils.logging import get_logger
 from sqlmodel import select
 import hashlib
@@ -112,7 +113,6 @@ class AutoGenerateResponse(BaseModel):
 @router.post("/generate", response_model=AutoGenerateResponse)
 async def auto_generate_video(
     request: AutoGenerateRequest,
-    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     _api_key: str = Depends(verify_api_key),
 ):
@@ -158,21 +158,18 @@ async def auto_generate_video(
         "enable_captions": request.enable_captions,
         "auto_upload": request.auto_upload,
     }
+    # Insert with the generating status directly - no follow-up UPDATE round trip
     project = await project_crud.create(
         session=session,
         user_id=user_id,
         title=title,
         category=request.category,
         settings=settings_data,
+        status=ProjectStatus.GENERATING_SCRIPT,
     )
 
-    # Update status
-    await project_crud.update_status(
-        session=session, project_id=project.id, status=ProjectStatus.GENERATING_SCRIPT
-    )
-
-    # Start pipeline in background
-    background_tasks.add_task(
+    # Enqueue the pipeline on the bounded job queue
+    job_queue.enqueue(
         run_pipeline_background,
         project_id=str(project.id),
         user_id=str(user_id),
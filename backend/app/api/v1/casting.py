@@ -6,6 +6,7 @@ from uuid import UUID, uuid4
 import hashlib
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_session
@@ -149,3 +150,36 @@ async def preview_voice(
         raise HTTPException(
             status_code=500, detail=f"Failed to generate preview: {str(e)}"
         )
+
+
+@router.post("/projects/{project_id}/preview-voice/stream")
+async def preview_voice_stream(
+    project_id: UUID,
+    request: VoicePreviewRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: ClerkUser = Depends(get_current_user),
+):
+    """
+    Stream a voice preview as it is synthesized.
+
+    Audio bytes are sent as edge-tts produces them, so playback can start
+    well before the full sample is generated. Nothing touches disk and no
+    cleanup task is needed.
+    """
+    user_id = get_user_uuid(current_user)
+    project = await project_crud.get_by_id(
+        session=session, project_id=project_id, user_id=user_id
+    )
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    return StreamingResponse(
+        tts_service.stream_audio(
+            text=request.sample_text,
+            voice_id=request.voice_settings.voice_id,
+            rate=request.voice_settings.rate,
+            pitch=request.voice_settings.pitch,
+        ),
+        media_type="audio/mpeg",
+    )
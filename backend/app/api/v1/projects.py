@@ -1,19 +1,21 @@
 """Project management endpoints."""
 
+import asyncio
+import operator
+import shutil
 from typing import Optional
 from uuid import UUID
 from pathlib import Path
-import shutil
 
 from fastapi import (
     APIRouter,
     Depends,
     HTTPException,
-    BackgroundTasks,
     Query,
     UploadFile,
     File,
 )
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_session
@@ -33,12 +35,102 @@ from app.schemas.project import (
 )
 from app.models import ProjectStatus
 from app.graph import run_pipeline
+from app.services.job_queue import job_queue
 from app.utils.logging import get_logger
 from app.auth import ClerkUser, get_current_user
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Specialized Project -> ProjectResponse mapper, built once at import.
+# attrgetter pulls all fields in a single C-level call, so mapping a
+# 100-item list page is one tuple + dict per row instead of nine separate
+# attribute lookups and kwarg bindings.
+_PROJECT_FIELDS = (
+    "id",
+    "title",
+    "category",
+    "status",
+    "youtube_video_id",
+    "youtube_url",
+    "error_message",
+    "created_at",
+    "updated_at",
+)
+_project_getter = operator.attrgetter(*_PROJECT_FIELDS)
+
+
+def _project_response(project) -> ProjectResponse:
+    """Map a Project row to its response model without validation."""
+    values = dict(zip(_PROJECT_FIELDS, _project_getter(project)))
+    values["status"] = values["status"].value
+    return ProjectResponse.model_construct(**values)
+
+
+try:
+    import msgspec
+
+    class _Scene(msgspec.Struct):
+        """msgspec mirror of ScriptSceneResponse for fast JSONB conversion."""
+
+        speaker: str = ""
+        line: str = ""
+        duration: float = 3.0
+
+except ImportError:  # pragma: no cover - msgspec is in requirements
+    msgspec = None
+
+
+def _scene_responses(scenes_data: list) -> list:
+    """
+    Convert the scenes list from Script.content into response models.
+
+    msgspec.convert applies defaults and type checks in C, which is far
+    cheaper than per-item dict.get chains on long scripts; malformed rows
+    (or a missing msgspec) fall back to the tolerant dict path.
+    """
+    if msgspec is not None:
+        try:
+            return [
+                ScriptSceneResponse.model_construct(
+                    speaker=s.speaker, line=s.line, duration=s.duration
+                )
+                for s in msgspec.convert(
+                    scenes_data, type=list[_Scene], strict=False
+                )
+            ]
+        except msgspec.ValidationError:
+            pass
+    return [
+        ScriptSceneResponse.model_construct(
+            speaker=s.get("speaker", ""),
+            line=s.get("line", ""),
+            duration=s.get("duration", 3.0),
+        )
+        for s in scenes_data
+    ]
+
+
+def _encode_cursor(created_at, project_id) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    import base64
+
+    raw = f"{created_at.isoformat()}|{project_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    """Decode a cursor back to (created_at, id); raise HTTPException on junk."""
+    import base64
+    from datetime import datetime
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts, _, pid = raw.partition("|")
+        return datetime.fromisoformat(ts), UUID(pid)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 def get_user_uuid(clerk_user: ClerkUser) -> UUID:
     """
@@ -118,10 +210,9 @@ async def run_pipeline_background(
         )
 
 
-@router.post("", response_model=ProjectResponse)
+@router.post("")
 async def create_project(
     request: ProjectCreateRequest,
-    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     current_user: ClerkUser = Depends(get_current_user),
 ):
@@ -144,21 +235,18 @@ async def create_project(
         if request.voice_preference
         else None,
     }
+    # Insert with the generating status directly - no follow-up UPDATE round trip
     project = await project_crud.create(
         session=session,
         user_id=user_id,
         title=request.title,
         category=request.category,
         settings=settings,
+        status=ProjectStatus.GENERATING_SCRIPT,
     )
 
-    # Update status to generating
-    await project_crud.update_status(
-        session=session, project_id=project.id, status=ProjectStatus.GENERATING_SCRIPT
-    )
-
-    # Start pipeline in background
-    background_tasks.add_task(
+    # Enqueue the pipeline on the bounded job queue
+    job_queue.enqueue(
         run_pipeline_background,
         project_id=str(project.id),
         user_id=str(user_id),
@@ -179,17 +267,10 @@ async def create_project(
 
     logger.info("Project created", project_id=str(project.id), user_id=str(user_id))
 
-    return ProjectResponse(
-        id=project.id,
-        title=project.title,
-        category=project.category,
-        status=project.status.value,
-        youtube_video_id=project.youtube_video_id,
-        youtube_url=project.youtube_url,
-        error_message=project.error_message,
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-    )
+    response = _project_response(project)
+    # Serialize directly with orjson - the data comes from our own DB rows,
+    # so the outbound validation pass from response_model is redundant.
+    return ORJSONResponse(response.model_dump())
 
 
 @router.post("/upload-background")
@@ -232,16 +313,45 @@ async def upload_background(
     return {"url": url_path}
 
 
-@router.get("", response_model=ProjectListResponse)
+@router.get("")
 async def list_projects(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     category: Optional[str] = Query(None, description="Filter by category"),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous response's next_cursor"
+    ),
     session: AsyncSession = Depends(get_session),
     current_user: ClerkUser = Depends(get_current_user),
 ):
-    """List all projects for the current user with optional category filter."""
+    """
+    List all projects for the current user with optional category filter.
+
+    Passing a cursor switches to keyset pagination: the seek predicate is
+    constant-cost regardless of page depth and skips the COUNT(*) scan, at
+    the price of not reporting a total. Page/page_size pagination is kept
+    for existing callers.
+    """
     user_id = get_user_uuid(current_user)
+
+    if cursor is not None:
+        after = _decode_cursor(cursor)
+        items, next_key = await project_crud.list_by_user_keyset(
+            session=session,
+            user_id=user_id,
+            page_size=page_size,
+            category=category,
+            after=after,
+        )
+        response = ProjectListResponse.model_construct(
+            items=[_project_response(p) for p in items],
+            total=len(items),
+            page=1,
+            page_size=page_size,
+            next_cursor=_encode_cursor(*next_key) if next_key else None,
+        )
+        return ORJSONResponse(response.model_dump())
+
     items, total = await project_crud.list_by_user(
         session=session,
         user_id=user_id,
@@ -250,25 +360,20 @@ async def list_projects(
         category=category,
     )
 
-    return ProjectListResponse(
-        items=[
-            ProjectResponse(
-                id=p.id,
-                title=p.title,
-                category=p.category,
-                status=p.status.value,
-                youtube_video_id=p.youtube_video_id,
-                youtube_url=p.youtube_url,
-                error_message=p.error_message,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-            )
-            for p in items
-        ],
+    # Hand back a cursor so clients can continue with keyset pagination
+    # instead of ever-deeper OFFSETs
+    next_cursor = None
+    if items and len(items) == page_size:
+        next_cursor = _encode_cursor(items[-1].created_at, items[-1].id)
+
+    response = ProjectListResponse.model_construct(
+        items=[_project_response(p) for p in items],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.get("/preset-videos")
@@ -326,7 +431,74 @@ async def list_preset_music():
     return {"presets": presets}
 
 
-@router.get("/{project_id}", response_model=ProjectDetailResponse)
+@router.get("/{project_id}/events")
+async def project_events(
+    project_id: UUID,
+    current_user: ClerkUser = Depends(get_current_user),
+):
+    """
+    Stream project status transitions as Server-Sent Events.
+
+    Clients get each status change pushed the moment the watcher sees it
+    instead of polling GET /projects/{id} on an interval. The stream
+    closes itself once the project reaches a terminal state. Sessions are
+    opened per check rather than held for the stream's lifetime, so a
+    slow consumer doesn't pin a pooled connection.
+    """
+    import json
+    import time
+
+    from app.database import get_session_context
+
+    user_id = get_user_uuid(current_user)
+
+    async with get_session_context() as session:
+        project = await project_crud.get_by_id(
+            session=session, project_id=project_id, user_id=user_id
+        )
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    async def event_stream():
+        last_status = None
+        last_emit = time.monotonic()
+        while True:
+            async with get_session_context() as session:
+                current = await project_crud.get_by_id(
+                    session=session, project_id=project_id, user_id=user_id
+                )
+            if not current:
+                return
+
+            status = current.status.value
+            if status != last_status:
+                payload = {
+                    "status": status,
+                    "error_message": current.error_message,
+                }
+                yield f"data: {json.dumps(payload)}\n\n"
+                last_status = status
+                last_emit = time.monotonic()
+            elif time.monotonic() - last_emit >= 15:
+                # SSE comment as a heartbeat: long generation phases emit
+                # no status changes, and a silent stream trips client
+                # read timeouts and idle proxy cutoffs
+                yield ": keepalive\n\n"
+                last_emit = time.monotonic()
+
+            if status in ("completed", "failed"):
+                return
+
+            await asyncio.sleep(1)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{project_id}")
 async def get_project(
     project_id: UUID,
     session: AsyncSession = Depends(get_session),
@@ -334,15 +506,19 @@ async def get_project(
 ):
     """Get project details with all related data."""
     user_id = get_user_uuid(current_user)
+    # Scripts are resolved below via get_latest_script (LIMIT 1), so skip
+    # eager-loading every version's JSONB here
     project = await project_crud.get_with_relations(
-        session=session, project_id=project_id, user_id=user_id
+        session=session, project_id=project_id, user_id=user_id,
+        include_scripts=False,
     )
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Build response
-    response = ProjectDetailResponse(
+    # Build response with model_construct - the rows are our own, so field
+    # validation and coercion would only re-check what the DB already enforces.
+    response = ProjectDetailResponse.model_construct(
         id=project.id,
         title=project.title,
         category=project.category,
@@ -355,31 +531,27 @@ async def get_project(
         updated_at=project.updated_at,
     )
 
-    # Add script if exists
-    if project.scripts:
-        latest_script = max(project.scripts, key=lambda s: s.version)
+    # Add script if exists - latest version resolved in SQL (ORDER BY version
+    # DESC LIMIT 1) instead of loading every version and scanning in Python
+    latest_script = await project_crud.get_latest_script(
+        session=session, project_id=project_id
+    )
+    if latest_script:
         scenes_data = latest_script.content.get("scenes", [])
-        response.script = ScriptResponse(
+        response.script = ScriptResponse.model_construct(
             id=latest_script.id,
             version=latest_script.version,
-            scenes=[
-                ScriptSceneResponse(
-                    speaker=s.get("speaker", ""),
-                    line=s.get("line", ""),
-                    duration=s.get("duration", 3.0),
-                )
-                for s in scenes_data
-            ],
+            scenes=_scene_responses(scenes_data),
             created_at=latest_script.created_at,
         )
 
     # Add cast if exists
     if project.casts:
         latest_cast = project.casts[-1]
-        response.cast = CastResponse(
+        response.cast = CastResponse.model_construct(
             id=latest_cast.id,
             assignments={
-                name: CastAssignmentResponse(
+                name: CastAssignmentResponse.model_construct(
                     voice_id=settings.get("voice_id", ""),
                     pitch=settings.get("pitch", "+0Hz"),
                     rate=settings.get("rate", "+0%"),
@@ -391,7 +563,7 @@ async def get_project(
 
     # Add assets
     response.assets = [
-        AssetResponse(
+        AssetResponse.model_construct(
             id=asset.id,
             asset_type=asset.asset_type.value,
             file_path=asset.file_path,
@@ -403,14 +575,13 @@ async def get_project(
         for asset in project.assets
     ]
 
-    return response
+    return ORJSONResponse(response.model_dump())
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: UUID,
     request: ProjectUpdateRequest,
-    background_tasks: BackgroundTasks,
     regenerate: bool = Query(False, description="Regenerate video after update"),
     session: AsyncSession = Depends(get_session),
     current_user: ClerkUser = Depends(get_current_user),
@@ -475,8 +646,8 @@ async def update_project(
             # Get settings
             proj_settings = project.settings or {}
 
-            # Start pipeline in background
-            background_tasks.add_task(
+            # Enqueue the pipeline on the bounded job queue
+            job_queue.enqueue(
                 run_pipeline_background,
                 project_id=str(project.id),
                 user_id=str(user_id),
@@ -510,34 +681,39 @@ async def update_project(
 @router.post("/{project_id}/regenerate-audio")
 async def regenerate_audio(
     project_id: UUID,
-    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     current_user: ClerkUser = Depends(get_current_user),
 ):
     """Regenerate audio with current cast settings."""
-    import asyncio
     from app.graph.nodes.audio_generator import audio_generator_node
     from app.graph.nodes.video_composer import video_composer_node
     from app.models import Asset, AssetType
     from sqlmodel import delete
 
     user_id = get_user_uuid(current_user)
+    # Script and cast are resolved via their LIMIT-1 queries below
     project = await project_crud.get_with_relations(
-        session=session, project_id=project_id, user_id=user_id
+        session=session, project_id=project_id, user_id=user_id,
+        include_scripts=False,
     )
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    if not project.scripts or not project.casts:
+    # Get latest script and cast - extract values before async task
+    latest_script = await project_crud.get_latest_script(
+        session=session, project_id=project_id
+    )
+    latest_cast = await project_crud.get_latest_cast(
+        session=session, project_id=project_id
+    )
+
+    if not latest_script or not latest_cast:
         raise HTTPException(
             status_code=400,
             detail="Project needs script and cast before regenerating audio",
         )
 
-    # Get latest script and cast - extract values before async task
-    latest_script = max(project.scripts, key=lambda s: s.version)
-    latest_cast = project.casts[-1]
     script_content = latest_script.content
     cast_assignments = latest_cast.assignments
     project_id_str = str(project_id)
@@ -573,21 +749,22 @@ async def regenerate_audio(
         scenes_per_image = project_settings.get("scenes_per_image", 2)
         image_scene_indices = []
 
-    # Delete existing audio and video assets
+    # Delete existing audio and video assets and flip the status in a single
+    # transaction - the project row is already loaded, so a separate
+    # update_status call would just add another round trip and commit.
     await session.execute(
-        delete(Asset).where(
+        delete(Asset)
+        .where(
             Asset.project_id == project_id,
             (Asset.asset_type == AssetType.AUDIO)
             | (Asset.asset_type == AssetType.VIDEO),
         )
+        .execution_options(synchronize_session=False)
     )
+    project.status = ProjectStatus.GENERATING_AUDIO
+    session.add(project)
     await session.commit()
 
-    # Update status to generating_audio
-    await project_crud.update_status(
-        session=session, project_id=project_id, status=ProjectStatus.GENERATING_AUDIO
-    )
-
     # Build state for audio regeneration
     async def regenerate_task():
         from app.graph.state import GraphState
@@ -664,8 +841,7 @@ async def regenerate_audio(
                     error_message=str(e),
                 )
 
-    # Use asyncio.create_task for proper async context
-    asyncio.create_task(regenerate_task())
+    job_queue.enqueue(regenerate_task)
 
     return {"message": "Audio regeneration started", "project_id": project_id_str}
 
@@ -673,7 +849,6 @@ async def regenerate_audio(
 @router.post("/{project_id}/regenerate-video")
 async def regenerate_video(
     project_id: UUID,
-    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     current_user: ClerkUser = Depends(get_current_user),
 ):
@@ -683,8 +858,13 @@ async def regenerate_video(
     from sqlmodel import select, delete
 
     user_id = get_user_uuid(current_user)
-    project = await project_crud.get_by_id(
-        session=session, project_id=project_id, user_id=user_id
+    # Eager-load relations up front - touching project.assets on a plain
+    # get_by_id would trigger per-collection lazy loads, which the async
+    # session cannot service outside a greenlet context. Scripts are
+    # resolved via get_latest_script (LIMIT 1), so they're excluded.
+    project = await project_crud.get_with_relations(
+        session=session, project_id=project_id, user_id=user_id,
+        include_scripts=False,
     )
 
     if not project:
@@ -699,24 +879,29 @@ async def regenerate_video(
         )
 
     # Get script for metadata
-    if not project.scripts:
+    latest_script = await project_crud.get_latest_script(
+        session=session, project_id=project_id
+    )
+    if not latest_script:
         raise HTTPException(status_code=400, detail="No script found")
 
-    latest_script = max(project.scripts, key=lambda s: s.version)
-
-    # Delete existing video assets
+    # Delete existing video assets; skip ORM identity-map sync since the
+    # deleted rows are not touched again in this request
     await session.execute(
-        delete(Asset).where(
-            Asset.project_id == project_id, Asset.asset_type == AssetType.VIDEO
-        )
+        delete(Asset)
+        .where(Asset.project_id == project_id, Asset.asset_type == AssetType.VIDEO)
+        .execution_options(synchronize_session=False)
     )
     await session.commit()
 
-    # Sort audio files by scene index
-    audio_files = sorted(
-        [a.file_path for a in audio_assets],
-        key=lambda p: int(p.split("/")[-1].replace(".mp3", "")),
+    # Sort audio files by scene index. Legacy assets predate the scene_index
+    # column, so fall back to parsing the filename for those rows only.
+    audio_assets.sort(
+        key=lambda a: a.scene_index
+        if a.scene_index is not None
+        else int(a.file_path.split("/")[-1].replace(".mp3", ""))
     )
+    audio_files = [a.file_path for a in audio_assets]
 
     async def regenerate_task():
         from app.graph.state import GraphState
@@ -778,7 +963,7 @@ async def regenerate_video(
             video_path=state.get("video_path"),
         )
 
-    background_tasks.add_task(regenerate_task)
+    job_queue.enqueue(regenerate_task)
 
     return {"message": "Video regeneration started", "project_id": str(project_id)}
 
@@ -68,6 +68,8 @@ class Settings(BaseSettings):
     # Rate Limiting
     max_projects_per_hour: int = 10
     max_concurrent_video_jobs: int = 3
+    video_encoder: str = "auto"  # auto | libx264 | h264_nvenc | h264_qsv | h264_videotoolbox
+    tts_max_concurrency: int = 8  # simultaneous edge-tts requests per batch
     youtube_daily_upload_limit: int = 15
     youtube_token_expires_in: int = 3600  # 1 hour
 
@@ -85,8 +87,18 @@ class Settings(BaseSettings):
     image_width: int = 1280
     image_height: int = 720
     image_num_steps: int = 20
+    image_dtype: str = "fp16"  # fp16 | bf16 | fp32 (GPU inference precision)
+    image_torch_compile: bool = False  # torch.compile the SDXL UNet (slow first run)
+    image_max_workers: int = 2  # threads for diffusion + encode/save work
+    image_max_concurrent: int = 1  # simultaneous forwards admitted to the GPU
     enable_image_generation: bool = True
 
+    # Whisper Transcription
+    whisper_device: str = "auto"  # auto | cpu | cuda
+    whisper_compute_type: str = "auto"  # auto | int8 | int8_float16 | float16 | float32
+    whisper_model_path: str = ""  # local CTranslate2 model dir (see scripts/prepare_whisper.py)
+    preload_whisper: bool = False  # load the model at startup instead of first request
+
     @property
     def async_database_url(self) -> str:
         """Ensure the database URL uses asyncpg driver."""
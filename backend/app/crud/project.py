@@ -1,9 +1,10 @@
 """Project CRUD operations."""
 
+from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -20,13 +21,14 @@ class ProjectCRUD:
         title: str,
         category: Optional[str] = None,
         settings: Optional[dict] = None,
+        status: ProjectStatus = ProjectStatus.DRAFT,
     ) -> Project:
-        """Create a new project."""
+        """Create a new project, optionally with an initial pipeline status."""
         project = Project(
             user_id=user_id,
             title=title,
             category=category,
-            status=ProjectStatus.DRAFT,
+            status=status,
             settings=settings,
         )
         session.add(project)
@@ -45,19 +47,27 @@ class ProjectCRUD:
         return result.scalar_one_or_none()
 
     async def get_with_relations(
-        self, session: AsyncSession, project_id: UUID, user_id: Optional[UUID] = None
+        self,
+        session: AsyncSession,
+        project_id: UUID,
+        user_id: Optional[UUID] = None,
+        include_scripts: bool = True,
     ) -> Optional[Project]:
-        """Get project with all related data."""
-        stmt = (
-            select(Project)
-            .options(
-                selectinload(Project.scripts),
-                selectinload(Project.casts),
-                selectinload(Project.assets),
-                selectinload(Project.youtube_metadata),
-            )
-            .where(Project.id == project_id)
-        )
+        """
+        Get project with related data.
+
+        Callers that resolve the script with get_latest_script should pass
+        include_scripts=False: eagerly loading every Script version's
+        JSONB just to ignore it costs more than the LIMIT-1 query saves.
+        """
+        options = [
+            selectinload(Project.casts),
+            selectinload(Project.assets),
+            selectinload(Project.youtube_metadata),
+        ]
+        if include_scripts:
+            options.append(selectinload(Project.scripts))
+        stmt = select(Project).options(*options).where(Project.id == project_id)
         if user_id:
             stmt = stmt.where(Project.user_id == user_id)
         result = await session.execute(stmt)
@@ -82,12 +92,14 @@ class ProjectCRUD:
         total_result = await session.execute(count_stmt)
         total = total_result.scalar() or 0
 
-        # Get items
+        # Get items. The id tiebreak matches list_by_user_keyset so rows
+        # sharing a created_at sort identically on both paths - cursors
+        # handed out from an offset page must not skip or repeat rows.
         offset = (page - 1) * page_size
         stmt = (
             select(Project)
             .where(base_filter)
-            .order_by(Project.created_at.desc())
+            .order_by(Project.created_at.desc(), Project.id.desc())
             .offset(offset)
             .limit(page_size)
         )
@@ -96,6 +108,51 @@ class ProjectCRUD:
 
         return items, total
 
+    async def list_by_user_keyset(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        page_size: int = 20,
+        category: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Tuple[List[Project], Optional[Tuple[datetime, UUID]]]:
+        """
+        List projects using keyset pagination.
+
+        Unlike OFFSET, the (created_at, id) seek predicate costs the same
+        at page 1 and page 100, and no COUNT(*) scan is issued.
+
+        Args:
+            after: (created_at, id) of the last row on the previous page.
+
+        Returns:
+            Tuple of (items, next_key) where next_key is None on the
+            last page.
+        """
+        base_filter = Project.user_id == user_id
+        if category:
+            base_filter = base_filter & (Project.category == category)
+
+        stmt = (
+            select(Project)
+            .where(base_filter)
+            .order_by(Project.created_at.desc(), Project.id.desc())
+            .limit(page_size + 1)
+        )
+        if after:
+            stmt = stmt.where(tuple_(Project.created_at, Project.id) < after)
+
+        result = await session.execute(stmt)
+        items = list(result.scalars().all())
+
+        next_key = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            next_key = (last.created_at, last.id)
+
+        return items, next_key
+
     async def update_status(
         self,
         session: AsyncSession,
@@ -113,6 +170,19 @@ class ProjectCRUD:
             await session.refresh(project)
         return project
 
+    async def bulk_create_assets(
+        self, session: AsyncSession, rows: List[dict]
+    ) -> None:
+        """
+        Insert multiple asset rows in a single statement.
+
+        Does not commit - callers batch this with their surrounding status
+        update so the whole write lands in one transaction.
+        """
+        if not rows:
+            return
+        await session.execute(insert(Asset), rows)
+
     async def get_latest_script(
         self, session: AsyncSession, project_id: UUID
     ) -> Optional[Script]:
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import YouTubeConnection, YouTubeMetadata
@@ -37,15 +37,16 @@ class YouTubeCRUD:
         expires_at: datetime
     ) -> YouTubeConnection:
         """Create a new YouTube connection with encrypted tokens."""
-        # Deactivate any existing connections
-        stmt = select(YouTubeConnection).where(
-            YouTubeConnection.user_id == user_id
+        # Deactivate any existing connections in one bulk UPDATE rather than
+        # fetching and mutating each row in Python
+        await session.execute(
+            update(YouTubeConnection)
+            .where(
+                YouTubeConnection.user_id == user_id,
+                YouTubeConnection.is_active == True
+            )
+            .values(is_active=False)
         )
-        result = await session.execute(stmt)
-        existing = result.scalars().all()
-        for conn in existing:
-            conn.is_active = False
-            session.add(conn)
 
         # Create new connection with encrypted tokens
         connection = YouTubeConnection(
@@ -74,6 +75,8 @@ class YouTubeCRUD:
         if connection:
             connection.access_token = encryption_service.encrypt(access_token)
             connection.token_expires_at = expires_at
+            # Drop the cached epoch timestamp so expiry checks see the new value
+            connection.__dict__.pop("_expires_ts", None)
             session.add(connection)
             await session.commit()
             await session.refresh(connection)
@@ -85,18 +88,16 @@ class YouTubeCRUD:
         user_id: UUID
     ) -> bool:
         """Deactivate user's YouTube connection."""
-        stmt = select(YouTubeConnection).where(
-            YouTubeConnection.user_id == user_id,
-            YouTubeConnection.is_active == True
+        result = await session.execute(
+            update(YouTubeConnection)
+            .where(
+                YouTubeConnection.user_id == user_id,
+                YouTubeConnection.is_active == True
+            )
+            .values(is_active=False)
         )
-        result = await session.execute(stmt)
-        connection = result.scalar_one_or_none()
-        if connection:
-            connection.is_active = False
-            session.add(connection)
-            await session.commit()
-            return True
-        return False
+        await session.commit()
+        return result.rowcount > 0
 
     async def get_metadata(
         self,
@@ -130,6 +131,8 @@ class YouTubeCRUD:
             existing.tags = tags
             existing.category_id = category_id
             existing.privacy_status = privacy_status
+            # Drop the cached upload body so the next upload sees the edits
+            existing.__dict__.pop("_youtube_body", None)
             session.add(existing)
             await session.commit()
             await session.refresh(existing)
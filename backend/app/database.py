@@ -4,6 +4,7 @@ Uses async SQLAlchemy with asyncpg driver for PostgreSQL.
 """
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -23,7 +24,11 @@ engine = create_async_engine(
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
-    pool_recycle=3600
+    pool_recycle=3600,
+    # orjson is several times faster than stdlib json for the JSONB columns
+    # (script content, settings, tags) decoded on every project fetch
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads
 )
 
 # Session factory for creating async sessions
@@ -48,6 +53,30 @@ async def init_db() -> None:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def run_migrations() -> None:
+    """
+    Apply idempotent schema upgrades to an existing database.
+
+    init.sql only runs when Postgres initializes a fresh volume, and the
+    project has no Alembic setup, so columns added after a deployment's
+    first boot must be retrofitted here. Every statement is safe to
+    re-run.
+    """
+    statements = [
+        # assets.scene_index: ordering key for audio/video composition
+        "ALTER TABLE assets ADD COLUMN IF NOT EXISTS scene_index INTEGER",
+        "CREATE INDEX IF NOT EXISTS idx_assets_scene_index ON assets(scene_index)",
+        # Backfill legacy audio rows whose filename encodes the scene
+        # number (audio/<project_id>/<scene>.mp3)
+        r"UPDATE assets"
+        r" SET scene_index = substring(file_path FROM '(\d+)\.mp3$')::integer"
+        r" WHERE scene_index IS NULL AND file_path ~ '\d+\.mp3$'",
+    ]
+    async with engine.begin() as conn:
+        for statement in statements:
+            await conn.execute(text(statement))
+
+
 async def close_db() -> None:
     """
     Close database connections.
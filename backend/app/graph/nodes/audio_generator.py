@@ -5,9 +5,10 @@ AudioGenerator Node - Generates audio for each script scene.
 from typing import Dict, Any
 from uuid import uuid4
 
+from app.crud.project import project_crud
 from app.graph.state import GraphState
 from app.services.tts_service import tts_service
-from app.models import Asset, AssetType, ProjectStatus
+from app.models import AssetType, ProjectStatus
 from app.database import get_session_context
 from app.utils.logging import get_logger
 
@@ -33,10 +34,10 @@ async def audio_generator_node(state: GraphState) -> GraphState:
     cast_list = state["cast_list"]
     scenes = script_json.get("scenes", [])
 
-    # Use a list that preserves indices - None for failed scenes
-    audio_files = []
-    successful_count = 0
+    # Use a list that preserves indices - None for skipped/failed scenes
     scene_count = len(scenes)
+    audio_files = [None] * scene_count
+    successful_count = 0
 
     logger.info(
         "Starting audio generation",
@@ -44,64 +45,77 @@ async def audio_generator_node(state: GraphState) -> GraphState:
         total_scenes=scene_count,
     )
 
+    # Build specs for all non-empty scenes, then generate them concurrently
+    # in one bounded batch instead of one awaited TTS call per scene
+    scene_specs = []
+    for i, scene in enumerate(scenes):
+        speaker = scene.get("speaker", "Unknown")
+        line = scene.get("line", "")
+
+        # Skip empty lines
+        if not line or not line.strip():
+            logger.warning(
+                "Empty line in scene, skipping", scene_index=i, speaker=speaker
+            )
+            continue
+
+        # Get voice settings for this speaker
+        voice_settings = cast_list.get(
+            speaker,
+            {"voice_id": "en-US-AriaNeural", "pitch": "+0Hz", "rate": "+0%"},
+        )
+
+        scene_specs.append(
+            {
+                "scene_index": i,
+                "scene_id": str(i),
+                "speaker": speaker,
+                "text": line,
+                "voice_id": voice_settings["voice_id"],
+                "rate": voice_settings.get("rate", "+0%"),
+                "pitch": voice_settings.get("pitch", "+0Hz"),
+            }
+        )
+
+    results = await tts_service.generate_scenes_audio(
+        project_id=state["project_id"], scenes=scene_specs
+    )
+
     async with get_session_context() as session:
         from app.models import Project
 
-        for i, scene in enumerate(scenes):
-            speaker = scene.get("speaker", "Unknown")
-            line = scene.get("line", "")
+        asset_rows = []
+        for spec, audio_path in zip(scene_specs, results):
+            i = spec["scene_index"]
 
-            # Skip empty lines
-            if not line or not line.strip():
-                logger.warning(
-                    "Empty line in scene, skipping", scene_index=i, speaker=speaker
-                )
-                audio_files.append(None)
+            if audio_path is None:
+                error_msg = f"Audio generation failed for scene {i}"
+                state["errors"].append(error_msg)
                 continue
 
-            # Get voice settings for this speaker
-            voice_settings = cast_list.get(
-                speaker,
-                {"voice_id": "en-US-AriaNeural", "pitch": "+0Hz", "rate": "+0%"},
+            audio_files[i] = audio_path
+            successful_count += 1
+
+            asset_rows.append(
+                {
+                    "id": uuid4(),
+                    "project_id": state["project_id"],
+                    "asset_type": AssetType.AUDIO,
+                    "file_path": audio_path,
+                    "character_name": spec["speaker"],
+                    "scene_index": i,
+                }
             )
 
-            try:
-                # Generate audio file
-                audio_path = await tts_service.generate_scene_audio(
-                    project_id=state["project_id"],
-                    scene_id=str(i),
-                    text=line,
-                    voice_id=voice_settings["voice_id"],
-                    rate=voice_settings.get("rate", "+0%"),
-                    pitch=voice_settings.get("pitch", "+0Hz"),
-                )
-
-                audio_files.append(audio_path)
-                successful_count += 1
-
-                # Create asset record
-                asset = Asset(
-                    id=uuid4(),
-                    project_id=state["project_id"],
-                    asset_type=AssetType.AUDIO,
-                    file_path=audio_path,
-                    character_name=speaker,
-                )
-                session.add(asset)
-
-                logger.debug(
-                    "Scene audio generated", scene=i, speaker=speaker, path=audio_path
-                )
-
-            except Exception as e:
-                error_msg = f"Audio generation failed for scene {i}: {str(e)}"
-                logger.warning(error_msg)
-                state["errors"].append(error_msg)
-                # Add None to preserve index alignment
-                audio_files.append(None)
+            logger.debug(
+                "Scene audio generated",
+                scene=i,
+                speaker=spec["speaker"],
+                path=audio_path,
+            )
 
-            # Update progress (0.3 to 0.6 range)
-            state["progress"] = 0.3 + (0.3 * (i + 1) / scene_count)
+        # One INSERT for all scene assets instead of a row-at-a-time flush
+        await project_crud.bulk_create_assets(session, asset_rows)
 
         # Filter out None values to count successful files
         valid_audio_files = [p for p in audio_files if p is not None]
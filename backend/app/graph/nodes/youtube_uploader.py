@@ -65,6 +65,9 @@ async def youtube_uploader_node(state: GraphState) -> GraphState:
                     new_tokens["token"]
                 )
                 connection.token_expires_at = new_tokens["expiry"]
+                # Drop the memoized expiry so needs_refresh sees the new
+                # timestamp (same as YouTubeCRUD.update_tokens)
+                connection.__dict__.pop("_expires_ts", None)
                 session.add(connection)
 
                 access_token = new_tokens["token"]
@@ -3,17 +3,21 @@ FastAPI application entry point.
 Configures the application with all routes, middleware, and lifecycle handlers.
 """
 
+import asyncio
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
-from app.database import init_db, close_db, check_db_connection
+from app.database import init_db, close_db, check_db_connection, run_migrations
 from app.utils.logging import configure_logging, get_logger, bind_context, clear_context
 
 from app.api.v1.router import api_router
@@ -36,6 +40,17 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting application...", debug=settings.debug)
 
+    # Cap both generic threadpools. run_in_executor(None, ...) calls go to
+    # the loop's default executor; Starlette offloads sync endpoints and
+    # sync dependencies through anyio's separate limiter, which defaults
+    # to 40 tokens. Under bursty traffic either pool can fan out into that
+    # many concurrent sync calls and thrash the CPU. Media work has its
+    # own dedicated executors, so small pools are plenty for the rest.
+    sync_workers = min(8, os.cpu_count() or 1)
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=sync_workers))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = sync_workers
+
     # Create static directories if they don't exit
     static_path = Path(settings.static_dir)
     for subdir in ["audio", "videos", "previews"]:
@@ -48,15 +63,36 @@ async def lifespan(app: FastAPI):
         # Production should use: alembic upgrade head
         pass  # Tables are created by init.sql in Docker
 
+    # Retrofit schema changes onto databases created before them -
+    # init.sql only runs on fresh Postgres volumes. Best effort: the app
+    # has always been able to start with the database down.
+    try:
+        await run_migrations()
+    except Exception as e:
+        logger.warning("Schema migration failed", error=str(e))
+
+    # Start the pipeline job queue (bounded worker pool for generation jobs)
+    from app.services.job_queue import job_queue
+
+    await job_queue.start()
+
     # Built-in scheduler (disabled by default - use n8n instead)
     # Set SCHEDULER_ENABLED=true in .env to enable built-in scheduler
     from app.services.scheduler_service import start_scheduler, stop_scheduler
-    import os
 
     if os.environ.get("SCHEDULER_ENABLED", "false").lower() == "true":
         await start_scheduler()
         logger.info("Built-in scheduler initialized")
 
+    # Optionally warm the Whisper model so the first video job doesn't
+    # pay the multi-second load. Off by default: with uvicorn --reload
+    # every code change would reload the model for nothing.
+    if settings.preload_whisper:
+        from app.services.whisper_service import get_whisper_model
+
+        await asyncio.get_running_loop().run_in_executor(None, get_whisper_model)
+        logger.info("Whisper model preloaded")
+
     logger.info("Application startup complete")
 
     yield  # Application runs here
@@ -68,6 +104,7 @@ async def lifespan(app: FastAPI):
     if os.environ.get("SCHEDULER_ENABLED", "false").lower() == "true":
         stop_scheduler()
 
+    await job_queue.stop()
     await close_db()
     logger.info("Database connection closed")
 
@@ -79,6 +116,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -26,6 +26,7 @@ class AssetBase(SQLModel):
     file_path: str = Field(max_length=500, nullable=False)
     character_name: Optional[str] = Field(default=None, max_length=255)
     file_size_bytes: Optional[int] = Field(default=None, ge=0)
+    scene_index: Optional[int] = Field(default=None, index=True)
 
 
 class Asset(AssetBase, BaseUUIDModel, table=True):
@@ -58,6 +59,7 @@ class AssetCreate(SQLModel):
     file_path: str
     character_name: Optional[str] = None
     file_size_bytes: Optional[str] = None
+    scene_index: Optional[int] = None
 
 
 class AssetRead(AssetBase):
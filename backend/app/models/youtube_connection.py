@@ -1,7 +1,9 @@
 """
 YouTubeConnection model - stores OAuth tokens for YouTube API access.
 """
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
@@ -47,20 +49,29 @@ class YouTubeConnection(YouTubeConnectionBase, BaseUUIDModel, table=True):
     # Relationships
     user: Optional["User"] = Relationship(back_populates="youtube_connections")
 
+    @cached_property
+    def _expires_ts(self) -> float:
+        """
+        Expiry as an epoch timestamp, computed once per instance.
+
+        Comparing against time.time() avoids constructing a timezone-aware
+        datetime on every check. Pop this from __dict__ if
+        token_expires_at is reassigned (see YouTubeCRUD.update_tokens).
+        """
+        return self.token_expires_at.timestamp()
+
     def is_token_expired(self) -> bool:
         """Check if the access token has expired."""
-        return datetime.now(timezone.utc) >= self.token_expires_at
+        return time.time() >= self._expires_ts
 
     def needs_refresh(self, buffer_minutes: int=5) -> bool:
         """
         Check if token should be refreshed.
-        
+
         Args:
             buffer_minutes: Refresh this many minutes before expiry.
         """
-        from datetime import timedelta
-        buffer = timedelta(minutes=buffer_minutes)
-        return datetime.now(timezone.utc) >= (self.token_expires_at - buffer)
+        return time.time() + buffer_minutes * 60 >= self._expires_ts
 
 
 class YouTubeConnectionCreate(SQLModel):
@@ -60,21 +60,27 @@ class YouTubeMetadata(YouTubeMetadataBase, BaseUUIDModel, table=True):
     def to_youtube_body(self) -> Dict[str, Any]:
         """
         Convert to YouTube API video insert body format.
-        
-        Returns dict ready for YouTube API upload.
+
+        Returns dict ready for YouTube API upload. The body is identical
+        across upload retries, so it is built once and cached on the
+        instance; YouTubeCRUD.save_metadata drops the cache after edits.
         """
-        return {
-            "snippet": {
-                "title": self.title,
-                "description": self.description or "",
-                "tags": self.tags,
-                "categoryId": self.category_id,
-            },
-            "status": {
-                "privacyStatus": self.privacy_status.value,
-                "selfDeclaredMadeForKids": False,
+        body = self.__dict__.get("_youtube_body")
+        if body is None:
+            body = {
+                "snippet": {
+                    "title": self.title,
+                    "description": self.description or "",
+                    "tags": self.tags,
+                    "categoryId": self.category_id,
+                },
+                "status": {
+                    "privacyStatus": self.privacy_status.value,
+                    "selfDeclaredMadeForKids": False,
+                }
             }
-        }
+            self.__dict__["_youtube_body"] = body
+        return body
 
 
 class YouTubeMetadataCreate(SQLModel):
@@ -160,6 +160,9 @@ class ProjectListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    # Keyset cursor for the next page; None when this is the last page.
+    # Present only when paginating by cursor.
+    next_cursor: Optional[str] = None
 
 
 class ProjectUpdateRequest(BaseModel):
@@ -2,6 +2,7 @@
 from app.services.encryption_service import encryption_service
 from app.services.tts_service import tts_service
 from app.services.groq_service import groq_service
+from app.services.job_queue import job_queue
 from app.services.video_service import video_service
 from app.services.youtube_service import youtube_service
 
@@ -9,6 +10,7 @@ __all__ = [
     "encryption_service",
     "tts_service",
     "groq_service",
+    "job_queue",
     "video_service",
     "youtube_service",
 ]
\ No newline at end of file
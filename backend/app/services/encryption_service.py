@@ -1,34 +1,79 @@
 """
 Encryption service for securing OAuth tokens.
-Uses Fernet symmetric encryption.
+Uses AES-GCM (hardware-accelerated via OpenSSL/AES-NI).
+Legacy Fernet-encrypted values remain readable and are migrated
+lazily the next time they are re-encrypted.
 """
+import base64
+import os
+from functools import lru_cache
+
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from app.config import settings
 
+# Version byte prefixed to AES-GCM blobs. Legacy Fernet tokens never decode
+# to this prefix, so decrypt can tell the two formats apart.
+_AESGCM_VERSION = b"\x02"
+_NONCE_SIZE = 12
+
+
+@lru_cache(maxsize=1)
+def _key_bytes() -> bytes:
+    """
+    Resolve the 32-byte AES key once per process.
+
+    The configured key is the same urlsafe-base64 value used for Fernet,
+    so existing deployments keep their key material.
+    """
+    if not settings.token_encryption_key:
+        # Fallback for dev only
+        return os.urandom(32)
+    return base64.urlsafe_b64decode(settings.token_encryption_key.encode())
+
+
+@lru_cache(maxsize=1)
+def _aesgcm_cipher() -> AESGCM:
+    """Build the AES-GCM cipher once per process."""
+    return AESGCM(_key_bytes())
+
+
+@lru_cache(maxsize=1)
+def _legacy_fernet() -> Fernet:
+    """Fernet cipher kept only for decrypting pre-migration blobs."""
+    if not settings.token_encryption_key:
+        return Fernet(Fernet.generate_key())
+    return Fernet(settings.token_encryption_key.encode())
+
 
 class EncryptionService:
     """Service for encrypting and decrypting sensitive data."""
 
     def __init__(self):
-        """Initialze with key from settings."""
-        if not settings.token_encryption_key:
-            # Fallback for dev only
-            self.fernet = Fernet(Fernet.generate_key())
-        else:
-            self.fernet = Fernet(settings.token_encryption_key.encode())
+        """Initialze with cached ciphers."""
+        self.aesgcm = _aesgcm_cipher()
 
     def encrypt(self, text: str) -> str:
-        """Encrypt a string."""
-        return self.fernet.encrypt(text.encode()).decode()
+        """Encrypt a string. Stored as base64(version || nonce || ct+tag)."""
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = self.aesgcm.encrypt(nonce, text.encode(), None)
+        blob = _AESGCM_VERSION + nonce + ciphertext
+        return base64.urlsafe_b64encode(blob).decode()
 
     def decrypt(self, token: str) -> str:
-        """Decrypt a token."""
+        """Decrypt a token, handling both AES-GCM and legacy Fernet blobs."""
         if not token:
             return ""
         try:
-            return self.fernet.decrypt(token.encode()).decode()
+            blob = base64.urlsafe_b64decode(token.encode())
+            if blob[:1] == _AESGCM_VERSION:
+                nonce = blob[1:1 + _NONCE_SIZE]
+                ciphertext = blob[1 + _NONCE_SIZE:]
+                return self.aesgcm.decrypt(nonce, ciphertext, None).decode()
+            # Legacy Fernet blob written before the AES-GCM switch
+            return _legacy_fernet().decrypt(token.encode()).decode()
         except Exception:
             return ""
-    
+
 # Singleton instance
-encryption_service = EncryptionService()
\ No newline at end of file
+encryption_service = EncryptionService()
@@ -0,0 +1,112 @@
+"""
+Shared FFmpeg helpers for the video services.
+"""
+
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Union
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Hardware H.264 encoders in preference order. All are fixed-function
+# blocks that leave the CPU free for composition work.
+_HW_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox")
+
+
+def _test_encode(encoder: str) -> bool:
+    """
+    Verify an encoder actually works at runtime.
+
+    ffmpeg can be compiled with an encoder whose backing device or driver
+    is missing, so listing alone isn't enough - run a tiny null encode.
+    """
+    cmd = [
+        "ffmpeg",
+        "-v",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "color=c=black:s=128x128:d=0.1",
+        "-c:v",
+        encoder,
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=15).returncode == 0
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1)
+def detect_h264_encoder() -> str:
+    """
+    Pick the H.264 encoder to use, cached for the process lifetime.
+
+    Honors settings.video_encoder when set explicitly; with "auto",
+    probes the available hardware encoders and falls back to libx264.
+    """
+    if settings.video_encoder != "auto":
+        return settings.video_encoder
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        listed = result.stdout
+    except Exception:
+        return "libx264"
+
+    for encoder in _HW_ENCODERS:
+        if encoder in listed and _test_encode(encoder):
+            logger.info(f"Using hardware H.264 encoder: {encoder}")
+            return encoder
+
+    return "libx264"
+
+
+def probe_duration(path: Union[str, Path]) -> float:
+    """
+    Read a media file's duration from its container header via ffprobe.
+
+    Much cheaper than opening the file with MoviePy, which spawns an
+    ffmpeg subprocess and parses its log output.
+    """
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            str(path),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {path}: {result.stderr.strip()}")
+    return float(result.stdout.strip())
+
+
+def encoder_quality_args(encoder: str) -> List[str]:
+    """Rate-control arguments matching the selected encoder."""
+    if encoder == "h264_nvenc":
+        return ["-preset", "p4", "-rc", "vbr", "-cq", "28"]
+    if encoder == "h264_qsv":
+        return ["-preset", "veryfast", "-global_quality", "28"]
+    if encoder == "h264_videotoolbox":
+        return ["-q:v", "55"]
+    return ["-preset", "ultrafast", "-crf", "28"]
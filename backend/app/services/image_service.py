@@ -4,6 +4,7 @@ Image generation service using Stable Diffusion XL.
 
 import asyncio
 import gc
+import threading
 import torch
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -13,8 +14,13 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Limit concurrent image generation
-image_executor = ThreadPoolExecutor(max_workers=1)
+# Dedicated pool for diffusion work. Admission to the GPU itself is bounded
+# separately by a semaphore, so the extra thread lets PNG encode/disk writes
+# overlap with the next scene's forward pass instead of serializing behind it.
+image_executor = ThreadPoolExecutor(
+    max_workers=settings.image_max_workers, thread_name_prefix="sdxl"
+)
+_gpu_semaphore = asyncio.Semaphore(settings.image_max_concurrent)
 
 
 class ImageService:
@@ -25,6 +31,7 @@ class ImageService:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.pipe = None
         self._model_loaded = False
+        self._load_lock = threading.Lock()
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
 
         # Log GPU status on initialization
@@ -38,10 +45,22 @@ class ImageService:
             )
 
     def _load_model(self):
-        """Lazy load the SDXL model to save VRAM when not in use."""
+        """
+        Lazy load the SDXL model, thread-safe.
+
+        The executor runs multiple threads and only the GPU forward is
+        gated by the semaphore, so the load itself needs the same
+        double-checked lock the Whisper singleton uses - two concurrent
+        loads would double VRAM whenever image_max_concurrent is raised.
+        """
         if self._model_loaded:
             return
+        with self._load_lock:
+            if not self._model_loaded:
+                self._do_load_model()
 
+    def _do_load_model(self):
+        """Actually load the SDXL pipeline (call with _load_lock held)."""
         import time
 
         try:
@@ -57,9 +76,18 @@ class ImageService:
             start_time = time.time()
 
             if self.device == "cuda":
+                # Half precision halves weight/activation bandwidth, which
+                # diffusion is bound by. bf16 has fp32's exponent range and
+                # avoids fp16 overflow artifacts on Ampere and newer.
+                dtype = torch.float16
+                if settings.image_dtype == "bf16" and torch.cuda.is_bf16_supported():
+                    dtype = torch.bfloat16
+                elif settings.image_dtype == "fp32":
+                    dtype = torch.float32
+
                 self.pipe = StableDiffusionXLPipeline.from_pretrained(
                     "stabilityai/stable-diffusion-xl-base-1.0",
-                    torch_dtype=torch.float16,
+                    torch_dtype=dtype,
                     use_safetensors=True,
                     variant="fp16",
                 )
@@ -73,6 +101,24 @@ class ImageService:
                 self.pipe = self.pipe.to("cuda")
                 self.pipe.enable_attention_slicing()
 
+                if settings.image_torch_compile:
+                    import os
+
+                    # Persist Inductor's kernel cache so later process
+                    # starts skip recompilation; dynamic=True avoids a
+                    # recompile per resolution
+                    os.environ.setdefault(
+                        "TORCHINDUCTOR_CACHE_DIR",
+                        str(Path(settings.static_dir) / ".inductor_cache"),
+                    )
+                    logger.info("Compiling UNet with torch.compile...")
+                    self.pipe.unet = torch.compile(
+                        self.pipe.unet,
+                        mode="reduce-overhead",
+                        dynamic=True,
+                        fullgraph=False,
+                    )
+
                 # Log VRAM usage after loading
                 allocated = torch.cuda.memory_allocated(0) / (1024**3)
                 logger.info(f"Model on GPU. VRAM used: {allocated:.2f} GB")
@@ -106,12 +152,11 @@ class ImageService:
     def _generate_sync(
         self,
         prompt: str,
-        output_path: Path,
         width: int = 1280,
         height: int = 720,
         num_steps: int = 20,
-    ) -> str:
-        """Synchronous image generation (runs in thread pool)."""
+    ):
+        """Synchronous diffusion forward (runs in thread pool, GPU-bound)."""
         self._load_model()
 
         import time
@@ -131,19 +176,21 @@ class ImageService:
             gen_time = time.time() - start_time
             logger.info(f"Image generated in {gen_time:.1f}s")
 
-            # Save image
-            image.save(str(output_path), quality=95)
-
-            logger.info(f"Image saved: {output_path}")
-
-            # Return relative path
-            relative_path = output_path.relative_to(Path(settings.static_dir))
-            return str(relative_path).replace("\\", "/")
+            return image
 
         except Exception as e:
             logger.error(f"Image generation failed: {e}")
             raise
 
+    def _save_sync(self, image, output_path: Path) -> str:
+        """Encode and write the image to disk (CPU/IO-bound)."""
+        image.save(str(output_path), quality=95)
+        logger.info(f"Image saved: {output_path}")
+
+        # Return relative path
+        relative_path = output_path.relative_to(Path(settings.static_dir))
+        return relative_path.as_posix()
+
     async def generate_scene_image(
         self, project_id: str, scene_id: str, prompt: str
     ) -> str:
@@ -166,14 +213,20 @@ class ImageService:
 
         loop = asyncio.get_running_loop()
 
+        # The semaphore gates the GPU forward only; the save runs outside
+        # it so disk I/O overlaps with the next request's generation
+        async with _gpu_semaphore:
+            image = await loop.run_in_executor(
+                image_executor,
+                self._generate_sync,
+                prompt,
+                settings.image_width,
+                settings.image_height,
+                settings.image_num_steps,
+            )
+
         result = await loop.run_in_executor(
-            image_executor,
-            self._generate_sync,
-            prompt,
-            output_path,
-            settings.image_width,
-            settings.image_height,
-            settings.image_num_steps,
+            image_executor, self._save_sync, image, output_path
         )
 
         return result
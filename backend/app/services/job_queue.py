@@ -0,0 +1,92 @@
+"""
+In-process job queue for long-running pipeline work.
+
+FastAPI's BackgroundTasks runs jobs on the serving event loop with no
+admission control, so a burst of project creations fans out into an
+unbounded number of concurrent pipelines competing with request handling.
+This queue gives pipeline jobs a fixed worker pool: requests enqueue and
+return immediately, while at most max_workers jobs run at a time.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobQueue:
+    """Bounded asyncio worker pool for pipeline jobs."""
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self._queue: "asyncio.Queue[Tuple[Callable[..., Awaitable[Any]], tuple, dict]]" = (
+            asyncio.Queue()
+        )
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Spawn the worker tasks. Called from the application lifespan."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(i)) for i in range(self.max_workers)
+        ]
+        logger.info("Job queue started", workers=self.max_workers)
+
+    async def stop(self, drain_timeout: float = 30.0) -> None:
+        """
+        Drain outstanding jobs, then cancel the workers.
+
+        Cancelling straight away would rip CancelledError through a
+        running pipeline - past its except Exception handlers - and leave
+        that project parked in a GENERATING_* status with no FAILED
+        transition. Give jobs a grace period to finish first; cancel only
+        what is still running when the timeout expires.
+        """
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Job queue drain timed out, cancelling workers",
+                pending=self._queue.qsize(),
+            )
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Job queue stopped", pending=self._queue.qsize())
+
+    def enqueue(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> None:
+        """
+        Schedule an async job for execution.
+
+        Falls back to a detached task if the queue was never started
+        (e.g. when called outside the FastAPI lifespan in scripts/tests).
+        """
+        if not self._workers:
+            asyncio.ensure_future(func(*args, **kwargs))
+            return
+        self._queue.put_nowait((func, args, kwargs))
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            func, args, kwargs = await self._queue.get()
+            job_name = getattr(func, "__name__", repr(func))
+            try:
+                await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "Job failed", worker=worker_id, job=job_name, error=str(e)
+                )
+            finally:
+                self._queue.task_done()
+
+
+# Singleton instance - sized to the video job limit since pipeline jobs
+# are dominated by video composition
+job_queue = JobQueue(max_workers=settings.max_concurrent_video_jobs)
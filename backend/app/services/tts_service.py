@@ -3,10 +3,13 @@ Text-to-Speech service using edge-tts.
 """
 import edge_tts
 import asyncio
+import hashlib
 import os
 import re
+import shutil
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 
 import edge_tts
 from app.config import settings
@@ -14,6 +17,29 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Resolved once at import time; the service is a module-level singleton so
+# per-instance Path construction buys nothing
+_STATIC_DIR = Path(settings.static_dir)
+_OUTPUT_DIR = _STATIC_DIR / "audio"
+_PREVIEW_DIR = _STATIC_DIR / "previews"
+_CACHE_DIR = _STATIC_DIR / "audio_cache"
+
+# Compiled once: sanitization runs on every scene, so avoid re.cache
+# lookups and pattern re-parsing on the hot path. Disallowed characters
+# and control characters are both pure deletions, so one alternation
+# removes them in a single scan instead of two.
+_STRIP_RE = re.compile(r'[^\w\s.,!?;:\'"()\-–—…À-ɏ]|[\x00-\x1f\x7f-\x9f]', re.UNICODE)
+_WS_RE = re.compile(r'\s+')
+# One translate pass instead of chained str.replace calls
+_SSML_TABLE = str.maketrans({"&": "and", "<": "", ">": ""})
+
+# Voice catalog cache: the list is a network round trip to Microsoft and
+# changes rarely, so serve it from memory for an hour. The lock stops a
+# burst of /voices requests from all fetching at once.
+_VOICES_TTL_SECONDS = 3600
+_voices_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+_voices_lock = asyncio.Lock()
+
 
 def sanitize_text_for_tts(text: str) -> str:
     """
@@ -28,20 +54,15 @@ def sanitize_text_for_tts(text: str) -> str:
     if not text:
         return ""
     
-    # Remove emojis and special unicode characters (keep basic Latin, punctuation, numbers)
-    # This regex keeps letters, numbers, basic punctuation, and common accented characters
-    text = re.sub(r'[^\w\s.,!?;:\'"()\-–—…\u00C0-\u024F]', '', text, flags=re.UNICODE)
-    
-    # Remove control characters
-    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-    
+    # Remove emojis, special unicode, and control characters in one pass
+    # (keeps letters, numbers, basic punctuation, common accented characters)
+    text = _STRIP_RE.sub('', text)
+
     # Replace multiple spaces/newlines with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     # Escape characters that might conflict with SSML
-    text = text.replace('&', 'and')
-    text = text.replace('<', '')
-    text = text.replace('>', '')
+    text = text.translate(_SSML_TABLE)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -57,27 +78,79 @@ class TTSService:
     """Service for generating audio from text."""
 
     def __init__(self):
-        self.output_dir = Path(settings.static_dir) / "audio"
-        self.preview_dir = Path(settings.static_dir) / "previews"
+        # Maximum concurrent edge-tts requests. Generation is I/O bound on
+        # a WebSocket to the service, so moderate fan-out is safe.
+        self.max_concurrency = settings.tts_max_concurrency
+        self.output_dir = _OUTPUT_DIR
+        self.preview_dir = _PREVIEW_DIR
+        # Content-addressed cache: identical (voice, rate, pitch, text)
+        # requests reuse the previously generated file
+        self.cache_dir = _CACHE_DIR
+        # Static roots we've already created - skips a pair of stat/mkdir
+        # syscalls per scene during batch generation. Only the long-lived
+        # roots (previews/, audio_cache/) belong here: per-project dirs
+        # get deleted by regeneration and cleanup flows, so caching their
+        # existence would break re-runs of the same project.
+        self._created_dirs: set = set()
 
-    async def get_voices(self) -> List[Dict[str, Any]]:
-        """Get list of available voices."""
+    def _ensure_dir(self, path: Path) -> None:
+        """mkdir -p for a static root, only the first time we see it."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
+    @staticmethod
+    def _cache_key(voice_id: str, rate: str, pitch: str, text: str) -> str:
+        """Stable hash for a TTS request (blake2b - fast, stdlib-only)."""
+        payload = f"{voice_id}|{rate}|{pitch}|{text}".encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path) -> None:
+        """
+        Materialize src at dst, preferring a hard link (zero bytes copied)
+        and falling back to a regular copy across filesystems.
+        """
+        if dst.exists():
+            dst.unlink()
         try:
-            voices = await edge_tts.list_voices()
-            # Formar for frontend
-            return [
-                {
-                    "voice_id": v["ShortName"],
-                    "name": v["FriendlyName"],
-                    "gender": v["Gender"],
-                    "locale": v["Locale"],
-                    "tags": v.get("VoiceTag", {})
-                }
-                for v in voices
-            ]
-        except Exception as e:
-            logger.error("Failed to get voices", error=str(e))
-            return []
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    async def get_voices(self) -> List[Dict[str, Any]]:
+        """Get list of available voices (cached for an hour)."""
+        global _voices_cache
+
+        if _voices_cache and time.monotonic() - _voices_cache[0] < _VOICES_TTL_SECONDS:
+            return _voices_cache[1]
+
+        async with _voices_lock:
+            # Another waiter may have refreshed while we queued for the lock
+            if (
+                _voices_cache
+                and time.monotonic() - _voices_cache[0] < _VOICES_TTL_SECONDS
+            ):
+                return _voices_cache[1]
+
+            try:
+                voices = await edge_tts.list_voices()
+                # Formar for frontend
+                result = [
+                    {
+                        "voice_id": v["ShortName"],
+                        "name": v["FriendlyName"],
+                        "gender": v["Gender"],
+                        "locale": v["Locale"],
+                        "tags": v.get("VoiceTag", {})
+                    }
+                    for v in voices
+                ]
+                _voices_cache = (time.monotonic(), result)
+                return result
+            except Exception as e:
+                logger.error("Failed to get voices", error=str(e))
+                return []
 
     async def generate_preview(
         self,
@@ -95,7 +168,7 @@ class TTSService:
         import uuid
 
         # Ensure preview directory exists
-        self.preview_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.preview_dir)
 
         filename = f"{uuid.uuid4()}.mp3"
         output_path = self.preview_dir / filename
@@ -123,14 +196,28 @@ class TTSService:
         Returns:
             Relative path to the generated file.
         """
-        # Create project-specific directory
+        # Create project-specific directory - always, not via the cached
+        # _ensure_dir: regenerate flows rmtree this directory for the
+        # same project id between runs
         project_dir = self.output_dir / str(project_id)
         project_dir.mkdir(parents=True, exist_ok=True)
 
         filename = f"{scene_id}.mp3"
         output_path = project_dir / filename
 
-        return await self._generate_file(
+        # Cache hit: hard-link the cached file into place (zero bytes
+        # copied) and skip the TTS round trip entirely. Partial re-runs
+        # only pay for the scenes whose text or voice actually changed.
+        cache_path = self.cache_dir / f"{self._cache_key(voice_id, rate, pitch, text)}.mp3"
+        if cache_path.exists():
+            self._link_or_copy(cache_path, output_path)
+            logger.debug(
+                "TTS cache hit", scene_id=scene_id, cache_file=cache_path.name
+            )
+            relative_path = output_path.relative_to(_STATIC_DIR)
+            return relative_path.as_posix()
+
+        result = await self._generate_file(
             text=text,
             voice_id=voice_id,
             rate=rate,
@@ -138,6 +225,77 @@ class TTSService:
             output_path=output_path
         )
 
+        # Populate the cache from the fresh file (best effort)
+        try:
+            self._ensure_dir(self.cache_dir)
+            self._link_or_copy(output_path, cache_path)
+        except OSError:
+            pass
+
+        return result
+
+    async def generate_scenes_audio(
+        self,
+        project_id: str,
+        scenes: List[Dict[str, Any]],
+    ) -> List[Any]:
+        """
+        Generate audio for multiple scenes concurrently.
+
+        Each scene dict needs: scene_id, text, voice_id, and optional
+        rate/pitch. Calls run under a semaphore so a long script fans out
+        to at most max_concurrency simultaneous TTS requests instead of
+        running scene-by-scene.
+
+        Returns:
+            List aligned with scenes: the relative audio path per scene,
+            or None where generation failed.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def generate_one(scene: Dict[str, Any]):
+            async with semaphore:
+                try:
+                    return await self.generate_scene_audio(
+                        project_id=project_id,
+                        scene_id=scene["scene_id"],
+                        text=scene["text"],
+                        voice_id=scene["voice_id"],
+                        rate=scene.get("rate", "+0%"),
+                        pitch=scene.get("pitch", "+0Hz"),
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Scene audio generation failed",
+                        scene_id=scene["scene_id"],
+                        error=str(e),
+                    )
+                    return None
+
+        return list(await asyncio.gather(*(generate_one(s) for s in scenes)))
+
+    async def stream_audio(
+        self,
+        text: str,
+        voice_id: str,
+        rate: str = "+0%",
+        pitch: str = "+0Hz",
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream synthesized audio as it arrives from edge-tts.
+
+        Yields mp3 chunks as the service produces them, so the first
+        audible bytes are available in well under a second instead of
+        after the full utterance - useful for previews where
+        time-to-first-audio is the perceived latency.
+        """
+        clean_text = sanitize_text_for_tts(text)
+        communicate = edge_tts.Communicate(clean_text, voice_id, rate=rate, pitch=pitch)
+
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
     async def _generate_file(
         self,
         text: str,
@@ -166,13 +324,23 @@ class TTSService:
                 pitch=pitch
             )
 
+            # Break any hard link to a cache entry before writing. A
+            # regenerated scene's output file shares its inode with the
+            # old cache entry; saving in place would truncate that inode
+            # and silently poison the old cache key with the new audio.
+            try:
+                os.unlink(output_path)
+            except FileNotFoundError:
+                pass
+
             await communicate.save(str(output_path))
-            
-            # Verify the file was created and has content
-            if not output_path.exists():
+
+            # Verify the file was created and has content - one stat
+            # covers both checks
+            try:
+                file_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 raise RuntimeError(f"Audio file was not created: {output_path}")
-            
-            file_size = output_path.stat().st_size
             if file_size < 100:  # MP3 files should be at least a few hundred bytes
                 logger.warning(
                     "Generated audio file is suspiciously small",
@@ -182,8 +350,8 @@ class TTSService:
 
             # Return path relative to static dir for URL generation
             # e.g., "audio/<project_id>/<scene_id>.mp3"
-            relative_path = output_path.relative_to(Path(settings.static_dir))
-            return str(relative_path).replace("\\", "/")
+            relative_path = output_path.relative_to(_STATIC_DIR)
+            return relative_path.as_posix()
 
         except Exception as e:
             logger.error(
@@ -4,6 +4,7 @@ Uses Whisper for word-level timestamps and animated ASS subtitles.
 """
 
 import asyncio
+import os
 import subprocess
 import shutil
 import time
@@ -13,11 +14,36 @@ from typing import List, Optional
 
 from moviepy.editor import AudioFileClip
 
+try:
+    import soundfile as sf
+except ImportError:  # pragma: no cover - soundfile is in requirements
+    sf = None
+
 from app.config import settings
+from app.services.ffmpeg_utils import detect_h264_encoder, encoder_quality_args
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+
+def _audio_duration(path: Path) -> float:
+    """
+    Read an audio file's duration from its header.
+
+    soundfile only parses the header (milliseconds); the MoviePy fallback
+    spawns an ffmpeg probe process per file.
+    """
+    if sf is not None:
+        try:
+            return float(sf.info(str(path)).duration)
+        except Exception:
+            pass
+    clip = AudioFileClip(str(path))
+    try:
+        return float(clip.duration)
+    finally:
+        clip.close()
+
 # Dedicated executor for video processing
 vertical_video_executor = ThreadPoolExecutor(max_workers=1)
 
@@ -86,7 +112,7 @@ class VerticalVideoService:
             )
 
             relative_path = output_path.relative_to(self.static_base)
-            return str(relative_path).replace("\\", "/")
+            return relative_path.as_posix()
 
         except Exception as e:
             logger.error(
@@ -110,19 +136,36 @@ class VerticalVideoService:
         """Compose video with Whisper transcription for accurate captions."""
         start_time = time.time()
 
-        valid_audio_paths = [p for p in audio_paths if p.exists()]
+        # One directory listing per parent instead of a stat syscall per
+        # scene - the audio files all sit in the project's audio directory
+        existing = set()
+        for parent in {p.parent for p in audio_paths}:
+            try:
+                with os.scandir(parent) as entries:
+                    existing.update(Path(entry.path) for entry in entries)
+            except OSError:
+                pass
+
+        valid_audio_paths = [p for p in audio_paths if p in existing]
         if not valid_audio_paths:
             raise ValueError("No valid audio files found")
 
+        # Per-scene durations, probed once from the source files; the merged
+        # track is their concatenation, so its duration is just the sum -
+        # no need to decode the merged file again
+        scene_durations = []
+        for audio_path in valid_audio_paths:
+            try:
+                scene_durations.append(_audio_duration(audio_path))
+            except Exception:
+                scene_durations.append(3.0)  # Default fallback
+
         # Step 1: Merge all audio
         logger.info(f"[1/5] Merging {len(valid_audio_paths)} audio files...")
         merged_audio_path = self.temp_dir / f"{project_id}_merged.mp3"
         self._merge_audio_ffmpeg(valid_audio_paths, merged_audio_path)
 
-        # Get total duration
-        audio = AudioFileClip(str(merged_audio_path))
-        total_duration = audio.duration
-        audio.close()
+        total_duration = sum(scene_durations)
         logger.info(f"  Total duration: {total_duration:.1f}s")
 
         # Step 2: Mix with background music if provided
@@ -145,16 +188,6 @@ class VerticalVideoService:
         logger.info("[3/5] Creating base video...")
         temp_video_path = self.temp_dir / f"{project_id}_temp.mp4"
 
-        # Get individual audio durations for scene-based images
-        scene_durations = []
-        for audio_path in valid_audio_paths:
-            try:
-                clip = AudioFileClip(str(audio_path))
-                scene_durations.append(clip.duration)
-                clip.close()
-            except Exception:
-                scene_durations.append(3.0)  # Default fallback
-
         # Priority: Images > Background Video > Solid Color
         valid_images = []
         if image_paths:
@@ -187,14 +220,16 @@ class VerticalVideoService:
                     transcribe_audio_with_timestamps,
                 )
 
-                words = transcribe_audio_with_timestamps(merged_audio_path)
+                word_data = transcribe_audio_with_timestamps(merged_audio_path)
 
-                if words:
-                    logger.info(f"  Got {len(words)} words with timestamps")
+                if word_data["words"]:
+                    logger.info(
+                        f"  Got {len(word_data['words'])} words with timestamps"
+                    )
 
                     # Generate animated ASS subtitles
                     ass_path = self.temp_dir / f"{project_id}.ass"
-                    self._generate_animated_ass(words, ass_path)
+                    self._generate_animated_ass(word_data, ass_path)
 
                     # Burn subtitles
                     logger.info("[5/5] Burning animated captions...")
@@ -224,12 +259,17 @@ class VerticalVideoService:
         elapsed = time.time() - start_time
         logger.info(f"Video created in {elapsed:.1f}s: {output_path}")
 
-    def _generate_animated_ass(self, words: List[dict], output_path: Path) -> None:
-        """Generate ASS subtitles with clean, punchy animations."""
+    def _generate_animated_ass(self, word_data: dict, output_path: Path) -> None:
+        """
+        Generate ASS subtitles with clean, punchy animations.
+
+        word_data is the whisper service's struct-of-arrays form:
+        'words' (list of str) with parallel 'starts'/'ends' arrays.
+        """
 
         # Clean, bold style with thick black outline for readability
         # Larger font (130pt), thick outline (8px), strong shadow
-        ass_content = f"""[Script Info]
+        header = f"""[Script Info]
 Title: Animated Captions
 ScriptType: v4.00+
 PlayResX: {WIDTH}
@@ -244,16 +284,25 @@ Style: Pop,Impact,130,&H00FFFFFF,&H000000FF,&H00000000,&HCC000000,1,0,0,0,100,10
 Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
 
-        for word_info in words:
-            start_time = self._seconds_to_ass_time(word_info["start"])
-            end_time = self._seconds_to_ass_time(word_info["end"])
-            word = word_info["word"].upper()
+        # Collect dialogue lines and join once - += on a growing string
+        # re-copies the whole buffer per word and turns long transcripts
+        # into quadratic work
+        lines = [header]
+
+        for word, start, end in zip(
+            word_data["words"],
+            word_data["starts"].tolist(),
+            word_data["ends"].tolist(),
+        ):
+            start_time = self._seconds_to_ass_time(start)
+            end_time = self._seconds_to_ass_time(end)
+            word = word.upper()
 
             # Clean the word
             word = word.replace("\\", "").replace("{", "").replace("}", "")
 
             # Calculate animation timing
-            duration_ms = int((word_info["end"] - word_info["start"]) * 1000)
+            duration_ms = int((end - start) * 1000)
             pop_time = min(50, duration_ms // 4)  # Quick pop (50ms max)
             settle_time = min(40, duration_ms // 5)  # Quick settle
 
@@ -268,21 +317,23 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 f"}}{word}"
             )
 
-            ass_content += (
+            lines.append(
                 f"Dialogue: 0,{start_time},{end_time},Pop,,0,0,0,,{animated_text}\n"
             )
 
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(ass_content)
+            f.write("".join(lines))
 
-        logger.info(f"  Generated animated ASS with {len(words)} words")
+        logger.info(f"  Generated animated ASS with {len(word_data['words'])} words")
 
     def _seconds_to_ass_time(self, seconds: float) -> str:
         """Convert seconds to ASS time format (H:MM:SS.CC)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        centisecs = int((seconds % 1) * 100)
+        # Runs twice per word; one int conversion + divmod chain instead
+        # of four float mod/floordiv round trips
+        centisecs = int(seconds * 100)
+        secs, centisecs = divmod(centisecs, 100)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
 
     def _merge_audio_ffmpeg(self, audio_paths: List[Path], output_path: Path) -> None:
@@ -348,6 +399,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         self, audio_path: Path, output_path: Path, duration: float
     ) -> None:
         """Create video with solid color background."""
+        encoder = detect_h264_encoder()
         cmd = [
             "ffmpeg",
             "-y",
@@ -358,11 +410,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             "-i",
             str(audio_path),
             "-c:v",
-            "libx264",
-            "-preset",
-            "ultrafast",
-            "-crf",
-            "28",
+            encoder,
+            *encoder_quality_args(encoder),
             "-c:a",
             "aac",
             "-shortest",
@@ -378,6 +427,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         self, bg_video_path: Path, audio_path: Path, output_path: Path, duration: float
     ) -> None:
         """Create video with looping background video."""
+        encoder = detect_h264_encoder()
         cmd = [
             "ffmpeg",
             "-y",
@@ -394,11 +444,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             "-map",
             "1:a",
             "-c:v",
-            "libx264",
-            "-preset",
-            "ultrafast",
-            "-crf",
-            "28",
+            encoder,
+            *encoder_quality_args(encoder),
             "-c:a",
             "aac",
             "-t",
@@ -421,6 +468,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         total_duration: float,
     ) -> None:
         """Create video from scene-based images with smooth Ken Burns effect."""
+        encoder = detect_h264_encoder()
 
         # Build list of (image_path, duration) for each scene
         scene_clips = []
@@ -439,66 +487,32 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             self._create_solid_video_ffmpeg(audio_path, output_path, total_duration)
             return
 
-        # Create individual scene videos and concatenate
-        scene_video_paths = []
+        # Create individual scene videos and concatenate. Each scene is an
+        # independent ffmpeg process, so render a few at once - the workers
+        # only wait on subprocesses, the encoding parallelism is ffmpeg's.
+        scene_video_paths = [
+            self.temp_dir / f"scene_{i}.mp4" for i in range(len(scene_clips))
+        ]
         concat_list_path = self.temp_dir / "concat_list.txt"
 
         try:
-            for i, (img_path, duration) in enumerate(scene_clips):
-                scene_video_path = self.temp_dir / f"scene_{i}.mp4"
-
-                if img_path and img_path.exists():
-                    # Create video from image with ultra-smooth Ken Burns effect
-                    # Use higher fps for buttery smooth animation
-                    fps = 30
-                    total_frames = int(duration * fps)
-
-                    # Ultra-smooth linear zoom - very subtle (5% total)
-                    # Simple linear progression: zoom = 1.0 + (0.05 * frame / total_frames)
-                    zoom_expr = f"1.0+0.05*on/{total_frames}"
-
-                    # Consistent slow pan to the LEFT (one direction only)
-                    # Pan 30 pixels total over the duration for subtle movement
-                    pan_pixels = 30
-                    x_expr = (
-                        f"iw/2-(iw/zoom/2)+{pan_pixels}-{pan_pixels}*on/{total_frames}"
+            import os
+
+            max_parallel = min(4, os.cpu_count() or 2, len(scene_clips))
+            with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+                futures = [
+                    pool.submit(
+                        self._build_scene_video,
+                        i,
+                        img_path,
+                        duration,
+                        scene_video_paths[i],
+                        encoder,
                     )
-                    y_expr = "ih/2-(ih/zoom/2)"
-
-                    cmd = [
-                        "ffmpeg",
-                        "-y",
-                        "-loop",
-                        "1",
-                        "-i",
-                        str(img_path),
-                        "-vf",
-                        f"scale=-1:2160,crop=1080:1920,zoompan=z='{zoom_expr}':x='{x_expr}':y='{y_expr}':d={total_frames}:s={WIDTH}x{HEIGHT}:fps={fps}",
-                        "-c:v",
-                        "libx264",
-                        "-preset",
-                        "ultrafast",
-                        "-crf",
-                        "28",
-                        "-t",
-                        str(duration),
-                        "-pix_fmt",
-                        "yuv420p",
-                        str(scene_video_path),
-                    ]
-
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    if result.returncode != 0:
-                        logger.warning(
-                            f"Scene {i} image video failed, using solid color: {result.stderr[:200]}"
-                        )
-                        # Fallback to solid color for this scene
-                        self._create_scene_solid_video(scene_video_path, duration)
-                else:
-                    # No image - create solid color scene
-                    self._create_scene_solid_video(scene_video_path, duration)
-
-                scene_video_paths.append(scene_video_path)
+                    for i, (img_path, duration) in enumerate(scene_clips)
+                ]
+                for future in futures:
+                    future.result()
 
             # Create concat list file - use relative paths from temp_dir
             with open(concat_list_path, "w", encoding="utf-8") as f:
@@ -526,6 +540,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 "-c:a",
                 "aac",
                 "-shortest",
+                "-movflags",
+                "+faststart",  # moov atom up front for instant playback start
                 str(output_path),
             ]
 
@@ -557,6 +573,72 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             except Exception:
                 pass
 
+    def _build_scene_video(
+        self,
+        i: int,
+        img_path: Optional[Path],
+        duration: float,
+        scene_video_path: Path,
+        encoder: str,
+    ) -> None:
+        """Render one scene's video segment (image Ken Burns or solid color)."""
+        if img_path and img_path.exists():
+            # Create video from image with ultra-smooth Ken Burns effect
+            # Use higher fps for buttery smooth animation
+            fps = 30
+            total_frames = int(duration * fps)
+
+            # Ultra-smooth linear zoom - very subtle (5% total)
+            # Simple linear progression: zoom = 1.0 + (0.05 * frame / total_frames)
+            zoom_expr = f"1.0+0.05*on/{total_frames}"
+
+            # Consistent slow pan to the LEFT (one direction only)
+            # Pan 30 pixels total over the duration for subtle movement
+            pan_pixels = 30
+            x_expr = f"iw/2-(iw/zoom/2)+{pan_pixels}-{pan_pixels}*on/{total_frames}"
+            y_expr = "ih/2-(ih/zoom/2)"
+
+            def run_encode(enc: str) -> subprocess.CompletedProcess:
+                cmd = [
+                    "ffmpeg",
+                    "-y",
+                    "-loop",
+                    "1",
+                    "-i",
+                    str(img_path),
+                    "-vf",
+                    f"scale=-1:2160,crop=1080:1920,zoompan=z='{zoom_expr}':x='{x_expr}':y='{y_expr}':d={total_frames}:s={WIDTH}x{HEIGHT}:fps={fps}",
+                    "-c:v",
+                    enc,
+                    *encoder_quality_args(enc),
+                    "-t",
+                    str(duration),
+                    "-pix_fmt",
+                    "yuv420p",
+                    str(scene_video_path),
+                ]
+                return subprocess.run(cmd, capture_output=True, text=True)
+
+            result = run_encode(encoder)
+            if result.returncode != 0 and encoder != "libx264":
+                # Hardware encoders can refuse sessions at runtime (NVENC
+                # caps concurrent sessions, and several scenes render in
+                # parallel) - retry in software before dropping the image
+                logger.warning(
+                    f"Scene {i} failed on {encoder}, retrying with libx264: "
+                    f"{result.stderr[:200]}"
+                )
+                result = run_encode("libx264")
+            if result.returncode != 0:
+                logger.warning(
+                    f"Scene {i} image video failed, using solid color: {result.stderr[:200]}"
+                )
+                # Fallback to solid color for this scene
+                self._create_scene_solid_video(scene_video_path, duration)
+        else:
+            # No image - create solid color scene
+            self._create_scene_solid_video(scene_video_path, duration)
+
     def _concat_videos_filter(
         self, video_paths: List[Path], audio_path: Path, output_path: Path
     ) -> None:
@@ -564,6 +646,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         if not video_paths:
             raise RuntimeError("No videos to concatenate")
 
+        encoder = detect_h264_encoder()
+
         # Build input arguments
         input_args = []
         for vpath in video_paths:
@@ -586,11 +670,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 "-map",
                 f"{n}:a",  # Audio is the last input
                 "-c:v",
-                "libx264",
-                "-preset",
-                "ultrafast",
-                "-crf",
-                "28",
+                encoder,
+                *encoder_quality_args(encoder),
                 "-c:a",
                 "aac",
                 "-shortest",
@@ -607,6 +688,10 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
     def _create_scene_solid_video(self, output_path: Path, duration: float) -> None:
         """Create a short solid color video for a single scene."""
+        # Always software-encode: this is the last resort for a scene -
+        # often reached because the hardware encoder just refused - and
+        # the concat step needs the file to exist, so failure here must
+        # raise rather than leave a hole in the concat list.
         cmd = [
             "ffmpeg",
             "-y",
@@ -616,17 +701,14 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             f"color=c=0x0f0f19:s={WIDTH}x{HEIGHT}:d={duration}:r=24",
             "-c:v",
             "libx264",
-            "-preset",
-            "ultrafast",
-            "-crf",
-            "28",
+            *encoder_quality_args("libx264"),
             "-pix_fmt",
             "yuv420p",
             str(output_path),
         ]
         result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
-            logger.warning(f"Scene solid video failed: {result.stderr[:200]}")
+            raise RuntimeError(f"Scene solid video failed: {result.stderr[:200]}")
 
     def _burn_subtitles_ffmpeg(
         self, input_path: Path, ass_path: Path, output_path: Path
@@ -643,6 +725,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         # Use forward slashes and escape colon
         ass_escaped = str(simple_ass_path).replace("\\", "/").replace(":", "\\:")
 
+        encoder = detect_h264_encoder()
+
         cmd = [
             "ffmpeg",
             "-y",
@@ -655,11 +739,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             "-c:a",
             "copy",
             "-c:v",
-            "libx264",
-            "-preset",
-            "ultrafast",
-            "-crf",
-            "28",
+            encoder,
+            *encoder_quality_args(encoder),
             "-threads",
             "0",
             str(output_path),
@@ -3,24 +3,94 @@ Video composition service using moviepy.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import os
+import subprocess
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
+import numpy as np
 from moviepy.editor import (
     AudioFileClip,
-    TextClip,
-    ColorClip,
     CompositeVideoClip,
+    ImageClip,
     concatenate_videoclips,
 )
+
+try:
+    import cv2
+except ImportError:  # pragma: no cover - opencv is in requirements
+    cv2 = None
+
 from app.config import settings
+from app.services.ffmpeg_utils import (
+    detect_h264_encoder,
+    encoder_quality_args,
+    probe_duration,
+)
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Limit concurrent video processing to avoid OOM
-video_executor = ThreadPoolExecutor(max_workers=settings.max_concurrent_video_jobs)
+# Limit concurrent video processing to avoid OOM, and keep
+# jobs x encode-threads at or below the core count so concurrent encodes
+# don't preempt each other's frame-producer threads. Jobs run in worker
+# processes: the MoviePy frame producer is CPU-bound Python that would
+# otherwise contend for the GIL with the event loop. Workers spawn
+# lazily on first submit, so importing this module in a worker is cheap.
+video_executor = ProcessPoolExecutor(
+    max_workers=min(
+        settings.max_concurrent_video_jobs, max(1, (os.cpu_count() or 4) // 4)
+    )
+)
+
+
+@lru_cache(maxsize=4)
+def _background_frame(width: int, height: int, color: tuple) -> np.ndarray:
+    """One constant background frame, shared by every scene that uses it."""
+    return np.full((height, width, 3), color, dtype=np.uint8)
+
+
+@lru_cache(maxsize=256)
+def _render_text_overlay(
+    speaker: str, line: str, fontsize: int = 30, size: tuple = (1000, 600)
+) -> np.ndarray:
+    """
+    Rasterize a caption to an RGBA array with Pillow.
+
+    Replaces ImageMagick TextClips, which shell out to `convert` per
+    scene. The LRU cache deduplicates repeated captions (speaker names
+    recur on every scene) so each unique overlay renders exactly once.
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    try:
+        font = ImageFont.truetype("DejaVuSans-Bold.ttf", fontsize)
+    except OSError:
+        font = ImageFont.load_default()
+
+    # Wrap to the overlay width; ~0.55 * fontsize approximates the
+    # average glyph advance for this font family
+    wrap_width = max(10, int(size[0] / (fontsize * 0.55)))
+    text = "\n\n".join(
+        textwrap.fill(part, width=wrap_width)
+        for part in (speaker, line)
+        if part
+    )
+
+    img = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.multiline_text(
+        (size[0] / 2, size[1] / 2),
+        text,
+        font=font,
+        fill="white",
+        anchor="mm",
+        align="center",
+    )
+    return np.asarray(img)
 
 
 class VideoService:
@@ -81,7 +151,7 @@ class VideoService:
 
             # Return relative path
             relative_path = output_path.relative_to(self.static_base)
-            return str(relative_path).replace("\\", "/")
+            return relative_path.as_posix()
 
         except Exception as e:
             logger.error(
@@ -99,6 +169,20 @@ class VideoService:
     ) -> None:
         """Blocking moviepy video composition logic with Ken Burns effect."""
 
+        # Fast path: without images every frame is the flat background plus
+        # a caption, which a single ffmpeg invocation renders directly -
+        # no per-frame Python/PIL round trips through the MoviePy
+        # compositor. Also taken when image paths were passed but none
+        # exist on disk, since every scene would fall back to the plain
+        # background anyway.
+        has_images = bool(image_paths) and any(p.exists() for p in image_paths)
+        if not has_images:
+            try:
+                self._compose_video_ffmpeg(audio_paths, meta_data, output_path)
+                return
+            except Exception as e:
+                logger.warning(f"ffmpeg fast path failed, using MoviePy: {e}")
+
         clips = []
 
         # Check if we should use static image (only 1 unique image)
@@ -128,29 +212,24 @@ class VideoService:
                     # Use generated image with Ken Burns effect
                     video_clip = self._create_ken_burns_clip(str(image_path), duration)
             else:
-                # Fallback: solid color background
+                # Fallback: solid color background, one shared frame
+                # array across every scene instead of a fresh ColorClip
+                # allocation each time
                 bg_color = (20, 20, 30)
-                video_clip = ColorClip(
-                    size=(1280, 720), color=bg_color, duration=duration
-                )
-            # Create text overlay
+                video_clip = ImageClip(
+                    _background_frame(1280, 720, bg_color)
+                ).set_duration(duration)
+            # Create text overlay (Pillow-rendered, cached per caption)
             try:
+                overlay = _render_text_overlay(meta["speaker"], meta["line"])
                 txt_clip = (
-                    TextClip(
-                        f"{meta['speaker']}\n\n{meta['line']}",
-                        fontsize=30,
-                        color="white",
-                        font="Arial-Bold",
-                        size=(1000, 600),
-                        method="caption",
-                        align="center",
-                    )
+                    ImageClip(overlay)
                     .set_position("center")
                     .set_duration(duration)
                 )
                 video_clip = CompositeVideoClip([video_clip, txt_clip])
             except Exception:
-                logger.warning("TextClip failed, using plain background")
+                logger.warning("Text overlay failed, using plain background")
 
             video_clip = video_clip.set_audio(audio_clip)
             clips.append(video_clip)
@@ -160,27 +239,147 @@ class VideoService:
 
         final_video = concatenate_videoclips(clips, method="compose")
 
-        final_video.write_videofile(
+        # Hardware encoder when one probes healthy; retry with libx264 if
+        # it fails at encode time (probe success doesn't guarantee the
+        # driver accepts this resolution/session count)
+        encoder = detect_h264_encoder()
+        try:
+            self._write_videofile(final_video, output_path, encoder)
+        except Exception:
+            if encoder == "libx264":
+                raise
+            logger.warning(f"{encoder} failed mid-encode, retrying with libx264")
+            self._write_videofile(final_video, output_path, "libx264")
+
+        final_video.close()
+        for clip in clips:
+            clip.close()
+
+    @staticmethod
+    def _write_videofile(clip, output_path: Path, encoder: str) -> None:
+        """Encode a MoviePy clip with the given H.264 encoder."""
+        # faststart moves the moov atom to the front so playback can
+        # begin before the file is fully downloaded
+        ffmpeg_params = [
+            "-threads",
+            "4",
+            "-movflags",
+            "+faststart",
+            *encoder_quality_args(encoder),
+        ]
+        if encoder == "libx264":
+            # x264 spawns lookahead threads on top of -threads, which
+            # oversubscribes the host when several jobs encode at once
+            ffmpeg_params += ["-x264-params", "lookahead-threads=1:sliced-threads=0"]
+        clip.write_videofile(
             str(output_path),
             fps=24,
-            codec="libx264",
+            codec=encoder,
             audio_codec="aac",
             threads=4,
+            ffmpeg_params=ffmpeg_params,
             logger=None,
         )
 
-        final_video.close()
-        for clip in clips:
-            clip.close()
+    def _compose_video_ffmpeg(
+        self,
+        audio_paths: List[Path],
+        meta_data: List[dict],
+        output_path: Path,
+    ) -> None:
+        """
+        Compose an imageless video with one ffmpeg invocation.
+
+        Audio scenes are joined with the concat demuxer, the background is
+        a lavfi color source, and captions are drawtext filters windowed
+        by cumulative scene durations. Unlike the MoviePy path there is no
+        0.5s pause between scenes - the audio plays back-to-back.
+        """
+        work_dir = output_path.parent
+
+        valid = []
+        durations = []
+        for audio_path, meta in zip(audio_paths, meta_data):
+            if not audio_path.exists():
+                logger.warning(f"Audio file missing: {audio_path}")
+                continue
+            valid.append((audio_path, meta))
+            durations.append(probe_duration(audio_path))
+
+        if not valid:
+            raise ValueError("No valid clips to concatenate")
+
+        concat_list = work_dir / "audio_concat.txt"
+        concat_list.write_text(
+            "".join(f"file '{p.resolve().as_posix()}'\n" for p, _ in valid)
+        )
+
+        # One drawtext per scene, enabled only during its audio window.
+        # textfile= sidesteps filtergraph escaping of the caption itself.
+        filters = []
+        text_files = []
+        offset = 0.0
+        for i, ((_, meta), duration) in enumerate(zip(valid, durations)):
+            text_file = work_dir / f"overlay_{i}.txt"
+            text_file.write_text(f"{meta['speaker']}\n\n{meta['line']}")
+            text_files.append(text_file)
+            filters.append(
+                "drawtext=font=Arial:fontsize=30:fontcolor=white"
+                f":textfile='{text_file.resolve().as_posix()}'"
+                ":x=(w-text_w)/2:y=(h-text_h)/2"
+                f":enable='between(t,{offset:.3f},{offset + duration:.3f})'"
+            )
+            offset += duration
+
+        encoder = detect_h264_encoder()
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            f"color=c=0x14141E:s=1280x720:r=24:d={offset:.3f}",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(concat_list),
+            "-filter_complex",
+            "[0:v]" + ",".join(filters) + "[v]",
+            "-map",
+            "[v]",
+            "-map",
+            "1:a",
+            "-c:v",
+            encoder,
+            *encoder_quality_args(encoder),
+            "-c:a",
+            "aac",
+            "-shortest",
+            "-movflags",
+            "+faststart",
+            str(output_path),
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        finally:
+            for f in [concat_list, *text_files]:
+                try:
+                    f.unlink()
+                except OSError:
+                    pass
+
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg composition failed: {result.stderr[-500:]}")
+
+        logger.info(f"Composed video via ffmpeg fast path: {output_path.name}")
 
     def _create_ken_burns_clip(self, image_path: str, duration: float):
         """Create a clip with Ken Burns (zoom/pan) effect."""
-        from moviepy.editor import ImageClip
         import random
 
-        # Load image
-        img_clip = ImageClip(image_path)
-
         # Random zoom direction (zoom in or out)
         zoom_in = random.choice([True, False])
 
@@ -197,6 +396,49 @@ class VideoService:
         pan_x = random.uniform(-0.05, 0.05)
         pan_y = random.uniform(-0.05, 0.05)
 
+        if cv2 is not None:
+            from moviepy.editor import VideoClip
+
+            # Decode once, then render each frame as a crop window + SIMD
+            # resize instead of MoviePy rescaling the full image per frame
+            src = cv2.cvtColor(cv2.imread(image_path), cv2.COLOR_BGR2RGB)
+            src_h, src_w = src.shape[:2]
+
+            def make_frame(t):
+                progress = t / duration if duration else 0.0
+                scale = start_scale + (end_scale - start_scale) * progress
+                crop_w = max(1, int(src_w / scale))
+                crop_h = max(1, int(src_h / scale))
+                cx = src_w / 2 + src_w * pan_x * progress
+                cy = src_h / 2 + src_h * pan_y * progress
+                x0 = int(min(max(cx - crop_w / 2, 0), src_w - crop_w))
+                y0 = int(min(max(cy - crop_h / 2, 0), src_h - crop_h))
+                window = src[y0 : y0 + crop_h, x0 : x0 + crop_w]
+                return cv2.resize(
+                    window, (1280, 720), interpolation=cv2.INTER_LINEAR
+                )
+
+            return VideoClip(make_frame, duration=duration)
+
+        return self._create_ken_burns_clip_moviepy(
+            image_path, duration, start_scale, end_scale, pan_x, pan_y
+        )
+
+    def _create_ken_burns_clip_moviepy(
+        self,
+        image_path: str,
+        duration: float,
+        start_scale: float,
+        end_scale: float,
+        pan_x: float,
+        pan_y: float,
+    ):
+        """MoviePy fallback for the Ken Burns effect (no OpenCV available)."""
+        from moviepy.editor import ImageClip
+
+        # Load image
+        img_clip = ImageClip(image_path)
+
         def resize_func(t):
             progress = t / duration
             scale = start_scale + (end_scale - start_scale) * progress
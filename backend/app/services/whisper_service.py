@@ -3,124 +3,330 @@ Whisper-based transcription service for word-level timestamps.
 Uses faster-whisper for efficient transcription.
 """
 
+import tempfile
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 import os
 
+import numpy as np
+
+try:
+    import soundfile as sf
+except ImportError:  # pragma: no cover - soundfile is in requirements
+    sf = None
+
+from app.config import settings
+from app.services.ffmpeg_utils import probe_duration
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Lazy load model to avoid memory issues
+
+def _resolve_device_and_compute() -> tuple:
+    """
+    Pick device/compute_type for CTranslate2, honoring settings overrides.
+
+    On GPU, int8_float16 uses tensor-core int8 GEMM; on CPU, dynamic int8
+    is roughly 2x faster than fp32 with negligible accuracy loss. "auto"
+    detects CUDA instead of hard-coding a device that may not exist.
+    """
+    device = settings.whisper_device
+    if device == "auto":
+        try:
+            import torch
+
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            device = "cpu"
+
+    compute_type = settings.whisper_compute_type
+    if compute_type == "auto":
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+
+    return device, compute_type
+
+# Lazy load model to avoid memory issues. Transcription runs on executor
+# threads, so loading is guarded by a lock - without it two concurrent
+# video jobs can race into from_pretrained and load the multi-GB model
+# twice.
 _whisper_model = None
+_batched_pipeline = None
+_model_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Drop inherited model state in forked children."""
+    global _whisper_model, _batched_pipeline, _model_lock
+    _whisper_model = None
+    _batched_pipeline = None
+    # A lock held by another parent thread at fork time would deadlock
+    # the child's first load, so replace it outright
+    _model_lock = threading.Lock()
+
+
+# Forked workers (the video ProcessPoolExecutor, preforked servers)
+# must not reuse the parent's handle: CTranslate2/CUDA state does not
+# survive fork, and every child keeping its own copy alive multiplies
+# RAM/VRAM by the worker count. A child that actually transcribes will
+# lazily load its own model instead.
+os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 def get_whisper_model():
-    """Get or create Whisper model (lazy loading)."""
+    """Get or create Whisper model (lazy loading, thread-safe)."""
     global _whisper_model
     if _whisper_model is None:
-        try:
-            from faster_whisper import WhisperModel
-            import os
-
-            # Use 'small' for better multilingual accuracy (Filipino, etc.)
-            # Can be overridden via WHISPER_MODEL env var
-            model_size = os.environ.get("WHISPER_MODEL", "medium")
-            logger.info(f"Loading Whisper model ({model_size}, CPU mode)...")
-            _whisper_model = WhisperModel(
-                model_size,  # 'small' is better for non-English
-                device="cpu",  # Use CPU to avoid CUDA issues
-                compute_type="int8",  # Faster inference on CPU
-            )
-            logger.info("Whisper model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load Whisper model: {e}")
-            raise
+        with _model_lock:
+            if _whisper_model is not None:
+                return _whisper_model
+            try:
+                from faster_whisper import WhisperModel
+
+                # Prefer a pre-converted local model dir: weights are
+                # already quantized on disk, so loading is an mmap instead
+                # of a per-process re-quantization (see
+                # scripts/prepare_whisper.py)
+                if settings.whisper_model_path and Path(settings.whisper_model_path).is_dir():
+                    model_size = settings.whisper_model_path
+                else:
+                    # Use 'small' for better multilingual accuracy (Filipino, etc.)
+                    # Can be overridden via WHISPER_MODEL env var
+                    model_size = os.environ.get("WHISPER_MODEL", "medium")
+                device, compute_type = _resolve_device_and_compute()
+                logger.info(
+                    f"Loading Whisper model ({model_size}, {device}/{compute_type})..."
+                )
+                kwargs = {}
+                if device == "cpu":
+                    # Let CTranslate2 use every core for intra-op work; a
+                    # single worker avoids oversubscription with the video
+                    # executor threads
+                    kwargs = {"cpu_threads": os.cpu_count() or 4, "num_workers": 1}
+                _whisper_model = WhisperModel(
+                    model_size,  # 'small' is better for non-English
+                    device=device,
+                    compute_type=compute_type,
+                    **kwargs,
+                )
+                logger.info("Whisper model loaded successfully")
+            except Exception as e:
+                logger.error(f"Failed to load Whisper model: {e}")
+                raise
     return _whisper_model
 
 
-def transcribe_audio_with_timestamps(audio_path: Path) -> List[Dict]:
+def get_batched_pipeline():
+    """
+    Get or create a BatchedInferencePipeline wrapping the cached model.
+
+    Batching VAD-chunked segments into one forward pass is 3-4x faster
+    than sequential transcription on long audio. Returns None on
+    faster-whisper versions that predate the pipeline (<1.1), so callers
+    can fall back to plain model.transcribe.
+    """
+    global _batched_pipeline
+    if _batched_pipeline is None:
+        model = get_whisper_model()
+        with _model_lock:
+            if _batched_pipeline is not None:
+                return _batched_pipeline
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                return None
+            _batched_pipeline = BatchedInferencePipeline(model=model)
+    return _batched_pipeline
+
+
+def clear_whisper_model() -> None:
+    """Drop the cached model so the next call reloads it (frees memory)."""
+    global _whisper_model, _batched_pipeline
+    with _model_lock:
+        _whisper_model = None
+        _batched_pipeline = None
+    logger.info("Whisper model cache cleared")
+
+
+def _empty_word_timestamps() -> Dict:
+    """The SoA shape with no words (failed or silent transcription)."""
+    return {
+        "words": [],
+        "starts": np.empty(0, dtype=np.float32),
+        "ends": np.empty(0, dtype=np.float32),
+    }
+
+
+def transcribe_audio_with_timestamps(audio_path: Path) -> Dict:
     """
     Transcribe audio and extract word-level timestamps.
 
     Returns:
-        List of dicts with 'word', 'start', 'end' keys
+        Struct-of-arrays dict: 'words' is a list of strings, 'starts'
+        and 'ends' are parallel float32 arrays. Long transcripts hold
+        tens of thousands of words; two flat arrays cost a fraction of
+        the per-word dicts they replace and downstream subtitle timing
+        reads them sequentially.
     """
     try:
-        model = get_whisper_model()
-
         logger.info(f"Transcribing: {audio_path.name}")
 
-        segments, info = model.transcribe(
-            str(audio_path),
-            word_timestamps=True,  # Enable word-level timestamps
-            language=None,  # Auto-detect language (supports Filipino/Tagalog)
+        # Narration clips are clean single-speaker speech, so greedy
+        # decoding (beam_size=1) loses nothing and skips most of the
+        # beam search cost; VAD drops the leading/trailing silence that
+        # dominates short scene clips. Language stays on auto-detect for
+        # Filipino/Tagalog scripts.
+        decode_options = dict(
+            word_timestamps=True,
+            language=None,
+            beam_size=1,
+            best_of=1,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=500),
         )
 
+        batched = get_batched_pipeline()
+        if batched is not None:
+            segments, info = batched.transcribe(
+                str(audio_path), batch_size=16, **decode_options
+            )
+        else:
+            segments, info = get_whisper_model().transcribe(
+                str(audio_path), **decode_options
+            )
+
         detected_lang = info.language if hasattr(info, "language") else "unknown"
         logger.info(f"  Detected language: {detected_lang}")
 
         words = []
+        starts = []
+        ends = []
         for segment in segments:
             if segment.words:
                 for word_info in segment.words:
-                    words.append(
-                        {
-                            "word": word_info.word.strip(),
-                            "start": word_info.start,
-                            "end": word_info.end,
-                        }
-                    )
+                    words.append(word_info.word.strip())
+                    starts.append(word_info.start)
+                    ends.append(word_info.end)
 
         logger.info(f"  Found {len(words)} words")
-        return words
+        return {
+            "words": words,
+            "starts": np.asarray(starts, dtype=np.float32),
+            "ends": np.asarray(ends, dtype=np.float32),
+        }
 
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
-        return []
+        return _empty_word_timestamps()
+
+
+def _transcribe_concatenated(audio_paths: List[Path]) -> Optional[Dict]:
+    """
+    Transcribe all clips as one concatenated waveform.
+
+    The Whisper encoder always processes 30s mel windows, so N short
+    scene clips cost N encoder spin-ups when transcribed separately; one
+    pass over the joined audio amortizes that, and the resulting word
+    timestamps are already on the combined timeline - no offset
+    stitching needed. Returns None when the clips can't be joined
+    (mixed sample rates, undecodable file).
+    """
+    pcms = []
+    samplerate = None
+    for audio_path in audio_paths:
+        data, sr = sf.read(str(audio_path), dtype="float32")
+        if data.ndim > 1:
+            data = data.mean(axis=1)
+        if samplerate is None:
+            samplerate = sr
+        elif sr != samplerate:
+            logger.warning("Mixed sample rates; transcribing per file")
+            return None
+        pcms.append(data)
+
+    combined = np.concatenate(pcms)
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        sf.write(str(tmp_path), combined, samplerate)
+        return transcribe_audio_with_timestamps(tmp_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def transcribe_multiple_audio_files(
     audio_paths: List[Path],
-) -> List[Dict]:
+) -> Dict:
     """
-    Transcribe multiple audio files and return combined word list
-    with adjusted timestamps.
+    Transcribe multiple audio files and return the combined words with
+    timestamps adjusted onto one timeline (same SoA shape as
+    transcribe_audio_with_timestamps).
     """
-    all_words = []
-    current_offset = 0.0
-
-    for i, audio_path in enumerate(audio_paths):
+    existing_paths = []
+    for audio_path in audio_paths:
         if not audio_path.exists():
             logger.warning(f"Audio file not found: {audio_path}")
             continue
+        existing_paths.append(audio_path)
+
+    # Preferred path: one Whisper pass over the concatenated audio
+    if sf is not None and len(existing_paths) > 1:
+        try:
+            result = _transcribe_concatenated(existing_paths)
+            if result and result["words"]:
+                logger.info(f"Total words transcribed: {len(result['words'])}")
+                return result
+        except Exception as e:
+            logger.warning(f"Concatenated transcription failed, falling back: {e}")
+
+    # Probe every duration up front. soundfile.info is an in-process
+    # libsndfile header read (microseconds); ffprobe covers formats
+    # libsndfile can't open, at the cost of a subprocess per file
+    durations = []
+    for audio_path in existing_paths:
+        duration = None
+        if sf is not None:
+            try:
+                duration = sf.info(str(audio_path)).duration
+            except Exception:
+                pass
+        if duration is None:
+            try:
+                duration = probe_duration(audio_path)
+            except Exception as e:
+                logger.warning(f"Could not get audio duration: {e}")
+        durations.append(duration)
+
+    all_words = []
+    start_arrays = []
+    end_arrays = []
+    current_offset = 0.0
 
+    for audio_path, duration in zip(existing_paths, durations):
         # Get words from this file
-        words = transcribe_audio_with_timestamps(audio_path)
-
-        # Adjust timestamps by offset
-        for word in words:
-            all_words.append(
-                {
-                    "word": word["word"],
-                    "start": word["start"] + current_offset,
-                    "end": word["end"] + current_offset,
-                }
-            )
+        scene = transcribe_audio_with_timestamps(audio_path)
 
-        # Update offset for next file
-        # Get audio duration
-        try:
-            from moviepy.editor import AudioFileClip
+        # Adjust timestamps by offset - one vectorized add over the file's
+        # arrays instead of per-word Python float arithmetic
+        if scene["words"]:
+            all_words.extend(scene["words"])
+            start_arrays.append(scene["starts"] + np.float32(current_offset))
+            end_arrays.append(scene["ends"] + np.float32(current_offset))
 
-            audio = AudioFileClip(str(audio_path))
-            current_offset += audio.duration
-            audio.close()
-        except Exception as e:
-            logger.warning(f"Could not get audio duration: {e}")
+        # Update offset for next file
+        if duration is not None:
+            current_offset += duration
+        elif scene["words"]:
             # Estimate from last word end time
-            if words:
-                current_offset = all_words[-1]["end"] + 0.1
+            current_offset = float(end_arrays[-1][-1]) + 0.1
 
     logger.info(f"Total words transcribed: {len(all_words)}")
-    return all_words
+    if not all_words:
+        return _empty_word_timestamps()
+    return {
+        "words": all_words,
+        "starts": np.concatenate(start_arrays),
+        "ends": np.concatenate(end_arrays),
+    }
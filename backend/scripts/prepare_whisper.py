@@ -0,0 +1,75 @@
+"""
+One-shot converter: pre-quantize a Whisper model to CTranslate2 int8.
+
+Passing compute_type="int8" to WhisperModel re-quantizes the fp16/fp32
+weights every process start, which costs seconds of boot time and extra
+RAM. Converting once to disk makes later loads a cheap mmap.
+
+Usage:
+    python scripts/prepare_whisper.py [--model medium] [--output-dir models/whisper-medium-int8]
+
+Then point the backend at the result:
+    WHISPER_MODEL_PATH=models/whisper-medium-int8
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--model",
+        default="medium",
+        help="Whisper size or HF model id (default: medium)",
+    )
+    parser.add_argument(
+        "--quantization",
+        default="int8",
+        help="CTranslate2 quantization (default: int8)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Where to write the converted model (default: models/whisper-<model>-<quant>)",
+    )
+    args = parser.parse_args()
+
+    model_id = args.model
+    if "/" not in model_id:
+        model_id = f"openai/whisper-{model_id}"
+
+    output_dir = args.output_dir or str(
+        Path("models") / f"whisper-{args.model.replace('/', '-')}-{args.quantization}"
+    )
+
+    if Path(output_dir).is_dir():
+        print(f"Already converted: {output_dir}")
+        return 0
+
+    cmd = [
+        "ct2-transformers-converter",
+        "--model",
+        model_id,
+        "--quantization",
+        args.quantization,
+        "--output_dir",
+        output_dir,
+        "--copy_files",
+        "tokenizer.json",
+        "preprocessor_config.json",
+    ]
+    print("Running:", " ".join(cmd))
+    result = subprocess.run(cmd)
+    if result.returncode != 0:
+        print("Conversion failed", file=sys.stderr)
+        return result.returncode
+
+    print(f"Done. Set WHISPER_MODEL_PATH={output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
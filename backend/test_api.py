@@ -1,13 +1,21 @@
 """Quick API test script."""
 import asyncio
+import json
+
 import httpx
-import time
 
 BASE_URL = "http://localhost:8000/api/v1"
 
 
 async def test_full_flow():
-    async with httpx.AsyncClient(timeout=120.0) as client:
+    # HTTP/2 with a keepalive pool: one TCP handshake serves the whole
+    # flow (create + event stream + detail fetch) instead of reconnecting
+    # per request
+    async with httpx.AsyncClient(
+        timeout=120.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+    ) as client:
         print("1. Creating project...")
         response = await client.post(
             f"{BASE_URL}/projects",
@@ -22,33 +30,55 @@ async def test_full_flow():
         print(f"Created project: {project_id}")
         print(f"Status: {project['status']}")
 
-        # Poll for completion
+        # Subscribe to status events - the server pushes each transition
+        # immediately instead of us polling every 5s
         print("\n2. Waiting for generation...")
-        for i in range(60):
-            await asyncio.sleep(5)
+        status = None
+        error_message = None
+        try:
+            async with client.stream(
+                "GET", f"{BASE_URL}/projects/{project_id}/events", timeout=360.0
+            ) as stream:
+                async for line in stream.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    event = json.loads(line[6:])
+                    status = event["status"]
+                    error_message = event.get("error_message")
+                    print(f"Status: {status}")
+                    if status in ("completed", "failed"):
+                        break
+        except httpx.ReadTimeout:
+            # Server keepalives should prevent this; poll as a safety net
+            print("   Event stream timed out, falling back to polling...")
+            for i in range(60):
+                await asyncio.sleep(5)
+                response = await client.get(f"{BASE_URL}/projects/{project_id}")
+                data = response.json()
+                status = data["status"]
+                error_message = data.get("error_message")
+                print(f"[{i*5}s] Status: {status}")
+                if status in ("completed", "failed"):
+                    break
+
+        if status == "completed":
             response = await client.get(f"{BASE_URL}/projects/{project_id}")
             data = response.json()
-            status = data["status"]
-            print(f"[{i*5}s] Status: {status}")
-
-            if status == "completed":
-                print("\n3. Generation completed!")
-                print(f"   Script scenes: {len(data.get('script', {}).get('scenes', []))}")
-                print(f"   Assets: {len(data.get('assets', []))}")
-
-                # Find video asset
-                video = next(
-                    (a for a in data.get("assets", []) if a["asset_type"] == "video"),
-                    None
-                )
-                if video:
-                    print(f"   Video URL: http://localhost:8000{video['url']}")
-                break
-            elif status == "failed":
-                print(f"\n   FAILED: {data.get('error_message')}")
-                break
+            print("\n3. Generation completed!")
+            print(f"   Script scenes: {len(data.get('script', {}).get('scenes', []))}")
+            print(f"   Assets: {len(data.get('assets', []))}")
+
+            # Find video asset
+            video = next(
+                (a for a in data.get("assets", []) if a["asset_type"] == "video"),
+                None
+            )
+            if video:
+                print(f"   Video URL: http://localhost:8000{video['url']}")
+        elif status == "failed":
+            print(f"\n   FAILED: {error_message}")
         else:
-            print("\n   Timeout waiting for completion")
+            print("\n   Event stream ended without completion")
 
     
 if __name__ == "__main__":
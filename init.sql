@@ -61,6 +61,7 @@ CREATE TABLE assets (
     file_path VARCHAR(500) NOT NULL,
     character_name VARCHAR(255),
     file_size_bytes BIGINT,
+    scene_index INTEGER,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 -- YouTube connections table
@@ -109,6 +110,7 @@ CREATE INDEX idx_projects_status ON projects(status);
 CREATE INDEX idx_scripts_project_id ON scripts(project_id);
 CREATE INDEX idx_casts_project_id ON casts(project_id);
 CREATE INDEX idx_assets_project_id ON assets(project_id);
+CREATE INDEX idx_assets_scene_index ON assets(scene_index);
 CREATE INDEX idx_youtube_connections_user_id ON youtube_connections(user_id);
 CREATE INDEX idx_youtube_metadata_project_id ON youtube_metadata(project_id);
 CREATE INDEX idx_scheduled_jobs_user_id ON scheduled_jobs(user_id);